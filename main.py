@@ -12,19 +12,26 @@ Usage:
     python workflow.py custom_job.txt     # Uses specific job file
 """
 
+import os
 import sys
 import asyncio
 import argparse
 from pathlib import Path
-import json
 import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from modules.qualifications_extractor import QualificationsExtractor
-from modules.cv_generator.generate_cv_pdf import CVPDFGenerator
-from modules.cover_letter_generator import CoverLetterGenerator
+# Light imports only: --batch worker processes import this module too. The
+# extractor, generators and Playwright are imported where they are used.
+from modules.shared import json_dumps_pretty, json_loads, write_file_atomic
+from modules.workflow_tasks import analyze_job_description, create_analysis_pool, parse_resume_pdf
+
+# Filename cleanup patterns, compiled once
+_ILLEGAL_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r'\s+')
 
 
 def sanitize_filename(text):
@@ -34,13 +41,50 @@ def sanitize_filename(text):
     
     # Remove special characters and replace spaces with nothing for job title/company
     # but keep spaces in person name
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', text)  # Remove illegal chars
-    sanitized = re.sub(r'\s+', '', sanitized) if text != text else sanitized  # Remove spaces for job/company
+    sanitized = _ILLEGAL_FILENAME_CHARS.sub('', text)  # Remove illegal chars
+    sanitized = _WHITESPACE.sub('', sanitized)  # Remove spaces for job/company
     return sanitized.strip()
 
 
-async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_default=False, word_limit=280, cl_add_top=None):
-    """Run the complete workflow"""
+def load_json(path):
+    """Read a JSON file, parsing the raw bytes with orjson when installed"""
+    return json_loads(Path(path).read_bytes())
+
+
+def save_json(path, data):
+    """Atomically write data as 2-space indented UTF-8 JSON, using orjson when installed"""
+    write_file_atomic(path, [json_dumps_pretty(data)])
+
+
+@lru_cache(maxsize=1)
+def _ats_scorer():
+    """ATSScorer built once and reused by every workflow run in this process"""
+    from modules.ats_checker.ats_scorer.scorers.ats_scorer import ATSScorer
+    return ATSScorer()
+
+
+@asynccontextmanager
+async def shared_browser():
+    """Chromium instance reused for every PDF rendered while the context is open"""
+    from playwright.async_api import async_playwright
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_default=False, word_limit=280, cl_add_top=None, browser=None, analysis_pool=None):
+    """Run the complete workflow
+
+    analysis_pool runs the job analysis and resume parsing; without one they
+    use the event loop's default thread pool.
+    """
+    from modules.qualifications_extractor import QualificationsExtractor
+    from modules.cv_generator.generate_cv_pdf import CVPDFGenerator
+    from modules.cover_letter_generator import CoverLetterGenerator
     
     print("🚀 STARTING ATS CV WORKFLOW")
     print("=" * 60)
@@ -53,6 +97,21 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
     scores_output_dir.mkdir(parents=True, exist_ok=True)
     cover_letter_dir.mkdir(parents=True, exist_ok=True)
     
+    # Read the job description once; the analysis below works on this text
+    try:
+        with open(job_file, 'r', encoding='utf-8') as f:
+            job_description = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Error reading job file: {e}")
+        return False
+
+    # The job analysis for scoring depends only on the job description, so it runs in
+    # the background (a --batch worker process, otherwise a thread) while qualifications
+    # are extracted and the CV is rendered; run_in_executor submits it before the loop
+    # next yields
+    loop = asyncio.get_running_loop()
+    job_data_future = loop.run_in_executor(analysis_pool, analyze_job_description, job_description)
+    
     # First, we need to extract qualifications to get job info for filename
     # Extract Qualifications (skip if --no-top is used)
     if not no_top:
@@ -70,8 +129,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
             # Load saved data to get job info
             quals_file = Path("modules/shared/qualifications/qualifications.json")
             if quals_file.exists():
-                with open(quals_file, 'r', encoding='utf-8') as f:
-                    quals_data = json.load(f)
+                quals_data = load_json(quals_file)
 
                 job_title = quals_data['metadata'].get('job_title', 'Unknown')
                 company_name = quals_data['metadata'].get('company_name', 'Unknown')
@@ -101,8 +159,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
 
         quals_file = Path("modules/shared/qualifications/qualifications.json")
         quals_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(quals_file, 'w', encoding='utf-8') as f:
-            json.dump(quals_data, f, indent=2)
+        save_json(quals_file, quals_data)
 
         job_title = "Not specified"
         company_name = "Not specified"
@@ -112,8 +169,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
 
     try:
         # Load personal info to get person name
-        with open("modules/shared/data/personal_info.json", 'r', encoding='utf-8') as f:
-            personal_data = json.load(f)
+        personal_data = load_json("modules/shared/data/personal_info.json")
 
         person_name = personal_data['personal_info'].get('name', 'Unknown')
 
@@ -122,19 +178,24 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
         safe_company = sanitize_filename(company_name)
         safe_person = person_name  # Keep spaces in person name
 
-        custom_filename = f"{safe_job_title}_{safe_company}_{safe_person}.pdf"
+        # Shared stem for the CV, score report and cover letter filenames
+        filename_stem = f"{safe_job_title}_{safe_company}_{safe_person}"
+        custom_filename = f"{filename_stem}.pdf"
         
         # Initialize CV generator with root output directory
         generator = CVPDFGenerator(
             data_file="modules/shared/data/personal_info.json",
-            template_file="modules/cv_generator/ats_cv_template.html"
+            template_file="modules/cv_generator/ats_cv_template.html",
+            personal_data=personal_data,
+            browser=browser
         )
         
         # Override output directory to output/pdf
         generator.output_dir = pdf_output_dir
         
         # Generate CV
-        output_path = await generator.run(custom_filename)
+        # Keep the rendered PDF in memory for scoring instead of reading the file back
+        pdf_bytes = await generator.run(custom_filename, return_bytes=True)
         # print(f"✅ Done")
         # print("-" * 40)
         
@@ -147,32 +208,18 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
     score_dict = None  # Initialize score_dict
 
     try:
-        # Import ATS checker
-        from modules.ats_checker.ats_scorer.scorers.ats_scorer import ATSScorer
-
-        # Initialize scorer
-        scorer = ATSScorer()
-
-        # Parse the generated PDF to extract resume data for scoring
-        from modules.ats_checker.ats_scorer.parsers.resume_parser import ResumeParser
-
-        pdf_path = pdf_output_dir / custom_filename
-        resume_parser = ResumeParser()
+        scorer = _ats_scorer()
 
+        # Parse the generated PDF to extract resume data for scoring, in the
+        # executor so it overlaps any job analysis still in progress
         try:
-            resume_data = resume_parser.parse(str(pdf_path))
+            resume_data = await loop.run_in_executor(analysis_pool, parse_resume_pdf, pdf_bytes, custom_filename)
         except Exception as parse_error:
             print(f"⚠️  Failed to parse PDF, using personal data: {parse_error}")
             resume_data = personal_data
 
-        with open(job_file, 'r', encoding='utf-8') as f:
-            job_description = f.read()
-
-        # First need to analyze the job description to get job_data
-        from modules.ats_checker.ats_scorer.analyzers.job_analyzer import JobAnalyzer
-
-        job_analyzer = JobAnalyzer()
-        job_data = job_analyzer.analyze(job_description)
+        # Job description analysis started at the beginning of the workflow
+        job_data = await job_data_future
 
         # Calculate ATS score using correct method
         score_result = scorer.score(resume_data, job_data)
@@ -221,7 +268,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
             print(f"\n✅ No missing keywords or skills detected!")
 
         # Save score report to output/scores directory
-        score_filename = custom_filename.replace('.pdf', '_score_report.json')
+        score_filename = f"{filename_stem}_score_report.json"
         score_path = scores_output_dir / score_filename
 
         # Convert ATSScore object to dict for JSON serialization
@@ -246,8 +293,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
             'recommendations': score_result.recommendations
         }
 
-        with open(score_path, 'w') as f:
-            json.dump(score_dict, f, indent=2)
+        save_json(score_path, score_dict)
 
 
     except Exception as e:
@@ -265,7 +311,8 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
             # Initialize cover letter generator
             cover_generator = CoverLetterGenerator(
                 output_dir=cover_letter_dir,
-                max_word_count=word_limit
+                max_word_count=word_limit,
+                browser=browser
             )
             
             # Extract company info if available
@@ -279,7 +326,7 @@ async def run_workflow(job_file, no_top=False, no_cover_letter=False, use_defaul
                 }
             
             # Generate cover letter filename
-            cover_letter_filename = f"CoverLetter_{safe_job_title}_{safe_company}_{safe_person}.pdf"
+            cover_letter_filename = f"CoverLetter_{filename_stem}.pdf"
             
             
             # Generate cover letter with score results
@@ -323,6 +370,7 @@ Examples:
   python workflow.py custom_job.txt --no-top    # Custom job file, no qualifications
   python workflow.py --no-top --no-cover-letter # CV only, no extras
   python workflow.py --default --no-cover-letter # Default qualifications, no cover letter
+  python workflow.py --batch jobs/              # Every *.txt job file in jobs/, one after another
         """
     )
     
@@ -371,22 +419,74 @@ Examples:
         help='Add content to the top of the cover letter. If cover letter starts with "I am excited to apply for" and value is "WRITE_IF_HUMAN", prepends the string on a new line before the existing content.'
     )
 
+    parser.add_argument(
+        '--batch',
+        metavar='DIR',
+        default=None,
+        help='Run the workflow for every *.txt job file in DIR in one process (job_file is ignored)'
+    )
+
     args = parser.parse_args()
     
-    # Check if job file exists
-    if not Path(args.job_file).exists():
-        print(f"❌ Error: Job file '{args.job_file}' not found")
-        sys.exit(1)
+    if args.batch:
+        if not os.path.isdir(args.batch):
+            print(f"❌ Error: Batch directory '{args.batch}' not found")
+            sys.exit(1)
+        job_files = sorted(str(path) for path in Path(args.batch).glob('*.txt') if path.is_file())
+        if not job_files:
+            print(f"❌ Error: No *.txt job files found in '{args.batch}'")
+            sys.exit(1)
+    else:
+        # Check if job file exists
+        if not os.path.exists(args.job_file):
+            print(f"❌ Error: Job file '{args.job_file}' not found")
+            sys.exit(1)
+        job_files = [args.job_file]
     
     try:
-        success = await run_workflow(
-            args.job_file,
-            no_top=args.no_top,
-            no_cover_letter=args.no_cover_letter,
-            use_default=args.default,
-            word_limit=args.word_limit,
-            cl_add_top=args.cl_add_top
-        )
+        # Jobs run one after another: each workflow hands its qualifications to the
+        # CV and cover letter generators through the shared qualifications.json.
+        # A batch still pays interpreter start-up, module imports and the
+        # Chromium launch only once; each PDF gets its own browser context.
+        failed = []
+        # Worker processes only pay off over a batch; a single run uses threads. The
+        # pool is created before Chromium is launched and shut down with it
+        analysis_pool = create_analysis_pool() if args.batch else None
+        try:
+            async with shared_browser() as browser:
+                for job_file in job_files:
+                    if len(job_files) > 1:
+                        print(f"\n📄 {job_file}")
+                    # An error in one job (e.g. an unreadable file) is reported and
+                    # the batch moves on to the next one
+                    try:
+                        job_success = await run_workflow(
+                            job_file,
+                            no_top=args.no_top,
+                            no_cover_letter=args.no_cover_letter,
+                            use_default=args.default,
+                            word_limit=args.word_limit,
+                            cl_add_top=args.cl_add_top,
+                            browser=browser,
+                            analysis_pool=analysis_pool
+                        )
+                    except Exception as e:
+                        print(f"❌ Error in workflow for '{job_file}': {e}")
+                        if args.verbose:
+                            import traceback
+                            traceback.print_exc()
+                        job_success = False
+                    if not job_success:
+                        failed.append(job_file)
+        finally:
+            if analysis_pool is not None:
+                analysis_pool.shutdown(cancel_futures=True)
+        
+        if len(job_files) > 1:
+            print(f"\n📊 Batch: {len(job_files) - len(failed)}/{len(job_files)} workflows succeeded")
+            for job_file in failed:
+                print(f"   ❌ {job_file}")
+        success = not failed
         
         if success:
             sys.exit(0)
@@ -2,7 +2,7 @@
 
 import re
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from collections import Counter
 
 from .keyword_extractor import KeywordExtractor
@@ -11,6 +11,58 @@ from ..utils.skill_categorizer import SkillCategorizer
 
 logger = logging.getLogger(__name__)
 
+# Requirement section headers; each captures the section body
+_REQUIRED_SECTION_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'required skills?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+    r'must have:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+    r'requirements?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+    r'qualifications?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+    r'essential skills?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+    r'mandatory:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
+))
+
+# Phrases that mark a skill as required
+_REQUIREMENT_INDICATOR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'you (?:must|should|need to) (?:have|know|understand|be proficient in|be experienced with)(.*?)(?:\.|,|\n)',
+    r'(?:proficiency|experience|expertise) (?:in|with|using)(.*?)(?:\.|,|\n)',
+    r'(?:strong|solid|deep) (?:knowledge|understanding|experience) (?:of|in|with)(.*?)(?:\.|,|\n)',
+    r'(?:minimum|at least) \d+ years? (?:of )?(?:experience|expertise) (?:in|with|using)(.*?)(?:\.|,|\n)',
+))
+
+# Preferred / nice-to-have section headers
+_PREFERRED_SECTION_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'preferred skills?:?(.*?)(?:requirements?|qualifications?|\n\n)',
+    r'nice to have:?(.*?)(?:requirements?|qualifications?|\n\n)',
+    r'desired skills?:?(.*?)(?:requirements?|qualifications?|\n\n)',
+    r'bonus:?(.*?)(?:requirements?|qualifications?|\n\n)',
+))
+
+# Degree patterns, checked in order
+_DEGREE_PATTERNS = {
+    'bachelor': re.compile(r"bachelor(?:'s)?(?:\s+(?:of|in))?\s+(?:science|arts|engineering|business|computer science)", re.IGNORECASE),
+    'master': re.compile(r"master(?:'s)?(?:\s+(?:of|in))?\s+(?:science|arts|engineering|business administration|computer science)", re.IGNORECASE),
+    'phd': re.compile(r"(?:phd|ph\.d\.|doctorate)", re.IGNORECASE),
+    'associate': re.compile(r"associate(?:'s)?\s+degree", re.IGNORECASE),
+}
+
+# Certification mentions
+_CERTIFICATION_PATTERNS = (
+    re.compile(r'(?:certified|certification)\s+\w+(?:\s+\w+){0,3}', re.IGNORECASE),
+    re.compile(r'[A-Z]{2,}(?:\+|\s+certified)', re.IGNORECASE),  # e.g., AWS, PMP, CISSP
+)
+
+# Job title candidates: first line, then labelled titles
+_TITLE_PATTERNS = (
+    re.compile(r'^([^\n]+)', re.IGNORECASE | re.MULTILINE),  # First line
+    re.compile(r'(?:position|title|role):\s*([^\n]+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'job title:\s*([^\n]+)', re.IGNORECASE | re.MULTILINE),
+)
+
+_YEARS_PATTERN = re.compile(r'(\d+)\+?\s*(?:to\s*(\d+))?\s*years?\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE)
+_SKILL_ITEM_SPLIT_PATTERN = re.compile(r'[\n•·\-*]|\d+\.')
+_LEADING_BULLET_PATTERN = re.compile(r'^[•·\-*\s]+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 class JobAnalyzer:
     """
@@ -34,8 +86,12 @@ class JobAnalyzer:
         """
         logger.info("Analyzing job description")
         
+        # Skills found anywhere in the text; scanned once and shared with
+        # the required-skill extraction
+        text_skills = self.skill_categorizer.extract_categorized_skills_from_text(job_description)
+        
         # Extract skills and categorize them
-        required_skills = self._extract_required_skills(job_description)
+        required_skills = self._extract_required_skills(job_description, text_skills)
         preferred_skills = self._extract_preferred_skills(job_description)
         
         # Categorize required skills
@@ -44,9 +100,6 @@ class JobAnalyzer:
         # Categorize preferred skills
         preferred_categorized = self.skill_categorizer.categorize_skills(preferred_skills)
         
-        # Extract skills directly from text
-        text_skills = self.skill_categorizer.extract_categorized_skills_from_text(job_description)
-        
         analysis = {
             'raw_text': job_description,
             'required_skills': required_skills,  # Keep original for backward compatibility
@@ -68,27 +121,20 @@ class JobAnalyzer:
         
         return analysis
     
-    def _extract_required_skills(self, text: str) -> List[str]:
+    def _extract_required_skills(self, text: str,
+                                 categorized_skills: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Extract required skills from job description."""
         # Use the skill categorizer to extract actual technical keywords from entire text
-        categorized_skills = self.skill_categorizer.extract_categorized_skills_from_text(text)
+        if categorized_skills is None:
+            categorized_skills = self.skill_categorizer.extract_categorized_skills_from_text(text)
         
         # Look for sections that indicate requirements and extract keywords from them
-        required_patterns = [
-            r'required skills?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-            r'must have:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-            r'requirements?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-            r'qualifications?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-            r'essential skills?:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-            r'mandatory:?(.*?)(?:preferred|desired|nice to have|responsibilities|\n\s*\n)',
-        ]
-        
         required_section_skills = []
         text_lower = text.lower()
         
         # Extract from specific requirement sections
-        for pattern in required_patterns:
-            matches = re.findall(pattern, text_lower, re.DOTALL | re.IGNORECASE)
+        for pattern in _REQUIRED_SECTION_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 # Extract keywords from this section using skill categorizer
                 section_skills = self.skill_categorizer.extract_categorized_skills_from_text(match)
@@ -96,16 +142,9 @@ class JobAnalyzer:
                 required_section_skills.extend(section_skills['soft_skills'])
         
         # Also look for skills mentioned with strong requirement indicators
-        requirement_indicators = [
-            r'you (?:must|should|need to) (?:have|know|understand|be proficient in|be experienced with)(.*?)(?:\.|,|\n)',
-            r'(?:proficiency|experience|expertise) (?:in|with|using)(.*?)(?:\.|,|\n)',
-            r'(?:strong|solid|deep) (?:knowledge|understanding|experience) (?:of|in|with)(.*?)(?:\.|,|\n)',
-            r'(?:minimum|at least) \d+ years? (?:of )?(?:experience|expertise) (?:in|with|using)(.*?)(?:\.|,|\n)',
-        ]
-        
         indicator_skills = []
-        for pattern in requirement_indicators:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        for pattern in _REQUIREMENT_INDICATOR_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 section_skills = self.skill_categorizer.extract_categorized_skills_from_text(match)
                 indicator_skills.extend(section_skills['hard_skills'])
@@ -129,17 +168,10 @@ class JobAnalyzer:
     
     def _extract_preferred_skills(self, text: str) -> List[str]:
         """Extract preferred/nice-to-have skills from job description."""
-        preferred_patterns = [
-            r'preferred skills?:?(.*?)(?:requirements?|qualifications?|\n\n)',
-            r'nice to have:?(.*?)(?:requirements?|qualifications?|\n\n)',
-            r'desired skills?:?(.*?)(?:requirements?|qualifications?|\n\n)',
-            r'bonus:?(.*?)(?:requirements?|qualifications?|\n\n)',
-        ]
-        
         preferred_section_skills = []
         text_lower = text.lower()
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, text_lower, re.DOTALL | re.IGNORECASE)
+        for pattern in _PREFERRED_SECTION_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 # Extract keywords from this section using skill categorizer
                 section_skills = self.skill_categorizer.extract_categorized_skills_from_text(match)
@@ -157,9 +189,8 @@ class JobAnalyzer:
             'specific_experience': []
         }
         
-        # Pattern to find years of experience
-        years_pattern = r'(\d+)\+?\s*(?:to\s*(\d+))?\s*years?\s*(?:of\s*)?(?:experience|exp)'
-        years_matches = re.findall(years_pattern, text, re.IGNORECASE)
+        # Find years of experience
+        years_matches = _YEARS_PATTERN.findall(text)
         
         if years_matches:
             min_years = years_matches[0][0]
@@ -194,17 +225,9 @@ class JobAnalyzer:
             'certifications': []
         }
         
-        # Degree patterns
-        degree_patterns = {
-            'bachelor': r"bachelor(?:'s)?(?:\s+(?:of|in))?\s+(?:science|arts|engineering|business|computer science)",
-            'master': r"master(?:'s)?(?:\s+(?:of|in))?\s+(?:science|arts|engineering|business administration|computer science)",
-            'phd': r"(?:phd|ph\.d\.|doctorate)",
-            'associate': r"associate(?:'s)?\s+degree",
-        }
-        
         text_lower = text.lower()
-        for level, pattern in degree_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for level, pattern in _DEGREE_PATTERNS.items():
+            if pattern.search(text_lower):
                 education['degree_level'] = level
                 break
         
@@ -220,13 +243,8 @@ class JobAnalyzer:
                 education['field_of_study'].append(field)
         
         # Extract certifications
-        cert_patterns = [
-            r'(?:certified|certification)\s+\w+(?:\s+\w+){0,3}',
-            r'[A-Z]{2,}(?:\+|\s+certified)',  # e.g., AWS, PMP, CISSP
-        ]
-        
-        for pattern in cert_patterns:
-            cert_matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _CERTIFICATION_PATTERNS:
+            cert_matches = pattern.findall(text)
             education['certifications'].extend(cert_matches)
         
         return education
@@ -234,14 +252,8 @@ class JobAnalyzer:
     def _extract_job_title(self, text: str) -> str:
         """Extract job title from job description."""
         # Usually the job title is at the beginning or after "Position:" or "Title:"
-        title_patterns = [
-            r'^([^\n]+)',  # First line
-            r'(?:position|title|role):\s*([^\n]+)',
-            r'job title:\s*([^\n]+)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 title = match.group(1).strip()
                 # Clean up the title
@@ -296,14 +308,14 @@ class JobAnalyzer:
         skills = []
         
         # Split by bullet points, numbers, or newlines
-        lines = re.split(r'[\n•·\-*]|\d+\.', text)
+        lines = _SKILL_ITEM_SPLIT_PATTERN.split(text)
         
         for line in lines:
             line = line.strip()
             if line and len(line) > 3:  # Filter out very short items
                 # Clean up the line
-                line = re.sub(r'^[•·\-*\s]+', '', line)
-                line = re.sub(r'\s+', ' ', line)
+                line = _LEADING_BULLET_PATTERN.sub('', line)
+                line = _WHITESPACE_PATTERN.sub(' ', line)
                 
                 # Split by commas if it's a comma-separated list
                 if ',' in line and len(line.split(',')) > 1:
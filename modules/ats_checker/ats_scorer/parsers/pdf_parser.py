@@ -1,7 +1,8 @@
 """PDF resume parser implementation."""
 
+import io
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -19,42 +20,58 @@ class PDFParser:
         Returns:
             Extracted text as a string
         """
+        return self._extract(file_path)
+    
+    def extract_text_from_bytes(self, data: bytes) -> str:
+        """
+        Extract text from PDF content already in memory.
+        
+        Args:
+            data: Raw PDF bytes
+            
+        Returns:
+            Extracted text as a string
+        """
+        return self._extract(io.BytesIO(data))
+    
+    def _extract(self, source: Union[str, BinaryIO]) -> str:
+        """Extract text from a file path or binary stream with the first available library."""
         try:
             import PyPDF2
         except ImportError:
             logger.warning("PyPDF2 not installed. Trying pdfplumber...")
             try:
                 import pdfplumber
-                return self._extract_with_pdfplumber(file_path)
+                return self._extract_with_pdfplumber(source)
             except ImportError:
                 raise ImportError(
                     "No PDF parsing library found. Install PyPDF2 or pdfplumber: "
                     "pip install PyPDF2 pdfplumber"
                 )
         
-        return self._extract_with_pypdf2(file_path)
+        return self._extract_with_pypdf2(source)
     
-    def _extract_with_pypdf2(self, file_path: str) -> str:
+    def _extract_with_pypdf2(self, source: Union[str, BinaryIO]) -> str:
         """Extract text using PyPDF2."""
         import PyPDF2
         
         text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
-            
-            for page_num in range(num_pages):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text()
+        # PdfReader opens paths itself and reads streams in place
+        pdf_reader = PyPDF2.PdfReader(source)
+        num_pages = len(pdf_reader.pages)
+        
+        for page_num in range(num_pages):
+            page = pdf_reader.pages[page_num]
+            text += page.extract_text()
         
         return text
     
-    def _extract_with_pdfplumber(self, file_path: str) -> str:
+    def _extract_with_pdfplumber(self, source: Union[str, BinaryIO]) -> str:
         """Extract text using pdfplumber."""
         import pdfplumber
         
         text = ""
-        with pdfplumber.open(file_path) as pdf:
+        with pdfplumber.open(source) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
@@ -1,6 +1,7 @@
 """Main resume parser that coordinates different format parsers."""
 
 import os
+import re
 from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
@@ -12,6 +13,18 @@ from ..utils.skill_categorizer import SkillCategorizer
 
 logger = logging.getLogger(__name__)
 
+# Contact detail patterns, compiled once at import
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_PATTERN = re.compile(r'(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')  # US format
+_LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+
+# Common action verbs in resumes
+_ACTION_VERBS = (
+    'managed', 'developed', 'created', 'implemented', 'designed',
+    'analyzed', 'improved', 'achieved', 'led', 'coordinated'
+)
+
 
 class ResumeParser:
     """
@@ -64,6 +77,29 @@ class ResumeParser:
             logger.error(f"Error parsing resume {file_path}: {e}")
             raise
     
+    def parse_bytes(self, data: bytes, file_name: str = "resume.pdf") -> Dict[str, Any]:
+        """
+        Parse a PDF resume held in memory, e.g. one just rendered by the CV generator.
+        
+        Args:
+            data: Raw PDF bytes
+            file_name: Name recorded in the result
+            
+        Returns:
+            Dictionary containing extracted resume information
+        """
+        logger.info(f"Parsing resume: {file_name} from memory with {self.pdf_parser.__class__.__name__}")
+        
+        try:
+            raw_text = self.pdf_parser.extract_text_from_bytes(data)
+            parsed_data = self._extract_information(raw_text)
+            parsed_data['file_name'] = file_name
+            parsed_data['file_format'] = '.pdf'
+            return parsed_data
+        except Exception as e:
+            logger.error(f"Error parsing resume {file_name}: {e}")
+            raise
+    
     def _extract_information(self, text: str) -> Dict[str, Any]:
         """
         Extract structured information from resume text.
@@ -98,8 +134,6 @@ class ResumeParser:
     
     def _extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
         """Extract contact information from resume text."""
-        import re
-        
         contact_info = {
             'email': None,
             'phone': None,
@@ -107,27 +141,23 @@ class ResumeParser:
             'github': None,
         }
         
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        # Email
+        email_match = _EMAIL_PATTERN.search(text)
         if email_match:
             contact_info['email'] = email_match.group()
         
-        # Phone pattern (US format)
-        phone_pattern = r'(\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phone_match = re.search(phone_pattern, text)
+        # Phone (US format)
+        phone_match = _PHONE_PATTERN.search(text)
         if phone_match:
             contact_info['phone'] = phone_match.group()
         
         # LinkedIn URL
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
+        linkedin_match = _LINKEDIN_PATTERN.search(text)
         if linkedin_match:
             contact_info['linkedin'] = linkedin_match.group()
         
         # GitHub URL
-        github_pattern = r'github\.com/[\w-]+'
-        github_match = re.search(github_pattern, text, re.IGNORECASE)
+        github_match = _GITHUB_PATTERN.search(text)
         if github_match:
             contact_info['github'] = github_match.group()
         
@@ -215,17 +245,7 @@ class ResumeParser:
         # This would typically use TF-IDF or other NLP techniques
         # For now, we'll extract technical terms and action verbs
         
-        keywords = []
-        
-        # Common action verbs in resumes
-        action_verbs = [
-            'managed', 'developed', 'created', 'implemented', 'designed',
-            'analyzed', 'improved', 'achieved', 'led', 'coordinated'
-        ]
-        
+        # Substring probes run at C speed; for ten short verbs they beat a
+        # single combined-regex pass over the text
         text_lower = text.lower()
-        for verb in action_verbs:
-            if verb in text_lower:
-                keywords.append(verb)
-        
-        return keywords
\ No newline at end of file
+        return [verb for verb in _ACTION_VERBS if verb in text_lower]
\ No newline at end of file
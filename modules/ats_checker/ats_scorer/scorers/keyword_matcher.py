@@ -1,34 +1,148 @@
 """Keyword matching utilities for ATS scoring using Groq LLM."""
 
+import asyncio
 import json
 import re
-from typing import List, Dict, Tuple, Set, Any, Optional
+import threading
+from collections import Counter, deque
+from typing import List, Dict, Tuple, Set, Any, Optional, FrozenSet, Callable
 import logging
 import sys
 from pathlib import Path
+from functools import lru_cache
 
 # Add path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 from modules.llm.groq_client import GroqClient
+from modules.shared import DEFAULT_CACHE_DIR, ResponseCache, canonical_key, find_near_match, json_loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every LLM response / context window, compiled once
+_JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+_WORD_PATTERN = re.compile(r'\w+')
+_CONTEXT_WORD_PATTERN = re.compile(r'\b[A-Za-z]+(?:\+\+|\#)?\b')
+
+# Recently answered prompts kept for near-match lookups
+_RECENT_PROMPTS_SIZE = 256
+
+# Common variations patterns for the non-LLM skill variation lookup
+_SKILL_VARIATIONS = {
+    'javascript': ('js', 'node.js', 'nodejs', 'javascript', 'ecmascript'),
+    'python': ('python', 'py', 'python3', 'python2', 'cpython'),
+    'machine learning': ('ml', 'machine learning', 'deep learning', 'neural networks'),
+    'artificial intelligence': ('ai', 'artificial intelligence', 'a.i.'),
+    'database': ('db', 'database', 'sql', 'nosql', 'rdbms'),
+    'continuous integration': ('ci', 'continuous integration', 'ci/cd'),
+    'continuous deployment': ('cd', 'continuous deployment', 'ci/cd'),
+    'user experience': ('ux', 'user experience', 'ux design'),
+    'user interface': ('ui', 'user interface', 'ui design'),
+}
+
+
+def _parse_json_object(response: str) -> Any:
+    """Parse the JSON object in an LLM response; raises ValueError if there is none."""
+    json_match = _JSON_OBJECT_PATTERN.search(response)
+    if not json_match:
+        raise ValueError("No valid JSON found in response")
+    return _json_loads(json_match.group())
+
+
+def _parse_json_array(response: str) -> List[Any]:
+    """Parse the JSON array in an LLM response; raises ValueError if there is none."""
+    json_match = _JSON_ARRAY_PATTERN.search(response)
+    if not json_match:
+        raise ValueError("No JSON array found in response")
+    result = _json_loads(json_match.group())
+    if not isinstance(result, list):
+        raise ValueError("Response JSON is not an array")
+    return result
+
+
+def _parse_combined_analysis(response: str) -> Dict[str, Any]:
+    """Parse an analyze_resume response; raises ValueError unless it has 'match' and 'gaps' objects."""
+    result = _parse_json_object(response)
+    if not (isinstance(result, dict) and isinstance(result.get('match'), dict)
+            and isinstance(result.get('gaps'), dict)):
+        raise ValueError("missing 'match' or 'gaps' section")
+    return result
+
+
+@lru_cache(maxsize=1)
+def _shared_llm_client() -> GroqClient:
+    """
+    The Groq client used by every KeywordMatcher, so its HTTP connection pool is reused.
+    
+    The configuration is fixed, so one client serves all instances; a failed
+    construction (e.g. no API key) is not cached and is retried next time.
+    """
+    return GroqClient(
+        model="meta-llama/llama-4-scout-17b-16e-instruct",
+        temperature=0.2,  # Lower temperature for more consistent results
+        max_tokens=2000
+    )
+
+
+@lru_cache(maxsize=128)
+def _find_skill_variations(skill: str, text: str) -> FrozenSet[str]:
+    """
+    Known variations of a skill (and the skill itself) that occur in text.
+    
+    Memoized because callers check many skills against the same resume text;
+    str caches its own hash, so repeat lookups with the same text are cheap.
+    """
+    skill_lower = skill.lower()
+    text_lower = text.lower()
+    
+    # Collect the known variations first so each one (e.g. 'ci/cd', listed
+    # under two bases) is searched for in the text only once
+    candidates = set()
+    for base_skill, variants in _SKILL_VARIATIONS.items():
+        if base_skill in skill_lower or skill_lower in base_skill:
+            candidates.update(variants)
+    variations = {variant for variant in candidates if variant in text_lower}
+    
+    # Also check for direct occurrence
+    if skill_lower in text_lower:
+        variations.add(skill)
+    
+    return frozenset(variations)
+
 
 class KeywordMatcher:
     """Match and score keywords between resume and job description using LLM."""
     
-    def __init__(self, similarity_threshold: float = 0.85, use_llm: bool = True):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        use_llm: bool = True,
+        cache_llm_responses: bool = False,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 86400.0,
+        near_match_threshold: Optional[float] = None
+    ):
         self.similarity_threshold = similarity_threshold
         self.use_llm = use_llm
+        # LLM response cache (opt-in): in-memory tier in front of one JSON file per
+        # prompt in cache_dir (default: modules/shared/cache/llm)
+        self.cache_llm_responses = cache_llm_responses
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.cache_ttl = cache_ttl
+        self._response_cache = ResponseCache(self.cache_dir, cache_ttl)
+        # Near-match tier (opt-in): word sets of recently answered prompts, so a prompt
+        # whose words are near-identical (Jaccard >= near_match_threshold) to one of
+        # them, under the same system prompt, reuses its cached response
+        self.near_match_threshold = near_match_threshold
+        self._recent_prompts: "deque[Tuple[str, FrozenSet[str], str]]" = deque(maxlen=_RECENT_PROMPTS_SIZE)
+        # Batch matching calls _cached_generate from executor threads; appends must
+        # not land while _near_match_key iterates the deque
+        self._recent_prompts_lock = threading.Lock()
         
         if self.use_llm:
             try:
-                self.llm_client = GroqClient(
-                    model="meta-llama/llama-4-scout-17b-16e-instruct",
-                    temperature=0.2,  # Lower temperature for more consistent results
-                    max_tokens=2000
-                )
+                self.llm_client = _shared_llm_client()
                 logger.info("LLM client initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize LLM client: {e}. Falling back to basic matching.")
@@ -85,30 +199,10 @@ Resume Keywords: {json.dumps(resume_keywords)}
 
 Match the keywords and return the analysis in the specified JSON format."""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
-            
             # Parse JSON response
             try:
-                # Clean the response to extract JSON
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    raise ValueError("No valid JSON found in response")
-                
-                # Calculate match rate
-                total_job_keywords = len(job_keywords) if job_keywords else 1
-                matched_count = (
-                    len(result.get('exact_matches', [])) +
-                    len(result.get('semantic_matches', [])) +
-                    len(result.get('related_matches', [])) * 0.5  # Related matches count as half
-                )
-                
-                result['match_rate'] = (matched_count / total_job_keywords) * 100
-                result['total_job_keywords'] = total_job_keywords
-                result['matched_count'] = matched_count
-                
-                return result
+                result = self._cached_generate(prompt, system_prompt, _parse_json_object)
+                return self._add_match_rate(result, job_keywords)
                 
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(f"Failed to parse LLM response: {e}")
@@ -118,6 +212,86 @@ Match the keywords and return the analysis in the specified JSON format."""
             logger.error(f"LLM keyword matching failed: {e}")
             return self._basic_match_keywords(resume_keywords, job_keywords)
     
+    def _add_match_rate(self, result: Dict[str, Any], job_keywords: List[str]) -> Dict[str, Any]:
+        """Add match_rate, total_job_keywords and matched_count to an LLM match result."""
+        total_job_keywords = len(job_keywords) if job_keywords else 1
+        matched_count = (
+            len(result.get('exact_matches', [])) +
+            len(result.get('semantic_matches', [])) +
+            len(result.get('related_matches', [])) * 0.5  # Related matches count as half
+        )
+        
+        result['match_rate'] = (matched_count / total_job_keywords) * 100
+        result['total_job_keywords'] = total_job_keywords
+        result['matched_count'] = matched_count
+        
+        return result
+    
+    async def amatch_keywords(
+        self,
+        resume_keywords: List[str],
+        job_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of match_keywords.
+        
+        The blocking call runs in the default executor, so it can be awaited
+        together with other LLM-backed calls and overlap their round trips.
+        
+        Args:
+            resume_keywords: Keywords from resume
+            job_keywords: Keywords from job description
+            
+        Returns:
+            Dictionary with matching results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.match_keywords, resume_keywords, job_keywords)
+    
+    async def amatch_keywords_batch(
+        self,
+        resume_keyword_lists: List[List[str]],
+        job_keywords: List[str],
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Match several resumes' keywords against one job's keywords concurrently.
+        
+        Args:
+            resume_keyword_lists: Keywords from each resume
+            job_keywords: Keywords from job description
+            max_concurrency: Maximum number of LLM calls in flight (rate limit)
+            
+        Returns:
+            Matching results, in the same order as resume_keyword_lists
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def match_one(resume_keywords: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.amatch_keywords(resume_keywords, job_keywords)
+        
+        return await asyncio.gather(*(match_one(keywords) for keywords in resume_keyword_lists))
+    
+    def match_keywords_batch(
+        self,
+        resume_keyword_lists: List[List[str]],
+        job_keywords: List[str],
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around amatch_keywords_batch.
+        
+        Args:
+            resume_keyword_lists: Keywords from each resume
+            job_keywords: Keywords from job description
+            max_concurrency: Maximum number of LLM calls in flight (rate limit)
+            
+        Returns:
+            Matching results, in the same order as resume_keyword_lists
+        """
+        return asyncio.run(self.amatch_keywords_batch(resume_keyword_lists, job_keywords, max_concurrency))
+    
     def extract_contextual_keywords(
         self,
         text: str,
@@ -148,13 +322,9 @@ Text:
 
 Return as JSON array: ["keyword1", "keyword2", ...]"""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
-            
             # Parse JSON array
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            if json_match:
-                keywords = json.loads(json_match.group())
-                return [k for k in keywords if isinstance(k, str) and len(k) > 2]
+            keywords = self._cached_generate(prompt, system_prompt, _parse_json_array)
+            return [k for k in keywords if isinstance(k, str) and len(k) > 2]
             
         except Exception as e:
             logger.warning(f"LLM contextual extraction failed: {e}")
@@ -180,11 +350,19 @@ Return as JSON array: ["keyword1", "keyword2", ...]"""
         densities = {}
         
         text_lower = text.lower()
+        # One tokenization pass serves every single-word keyword; a word-bounded
+        # regex match of such a keyword is exactly a whole \w+ token
+        word_counts = None
         
         for keyword in keywords:
             keyword_lower = keyword.lower()
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            occurrences = len(re.findall(pattern, text_lower))
+            if _WORD_PATTERN.fullmatch(keyword_lower):
+                if word_counts is None:
+                    word_counts = Counter(_WORD_PATTERN.findall(text_lower))
+                occurrences = word_counts[keyword_lower]
+            else:
+                pattern = r'\b' + re.escape(keyword_lower) + r'\b'
+                occurrences = len(re.findall(pattern, text_lower))
             
             if word_count > 0:
                 density = (occurrences / word_count) * 100
@@ -223,12 +401,8 @@ Return as JSON array: ["keyword1", "keyword2", ...]"""
 Include abbreviations, full names, related frameworks/libraries.
 Return as JSON array of actual terms found in the text."""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
-            
-            json_match = re.search(r'\[.*\]', response, re.DOTALL)
-            if json_match:
-                variations = json.loads(json_match.group())
-                return list(set([v for v in variations if isinstance(v, str)]))
+            variations = self._cached_generate(prompt, system_prompt, _parse_json_array)
+            return list(set([v for v in variations if isinstance(v, str)]))
                 
         except Exception as e:
             logger.warning(f"LLM skill variation detection failed: {e}")
@@ -279,12 +453,10 @@ Return JSON:
     "reasoning": "Brief explanation"
 }}"""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
-            
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                return float(result.get('score', 50.0))
+            return self._cached_generate(
+                prompt, system_prompt,
+                lambda response: float(_parse_json_object(response).get('score', 50.0))
+            )
                 
         except Exception as e:
             logger.warning(f"LLM relevance scoring failed: {e}")
@@ -330,17 +502,209 @@ Return JSON:
     "match_percentage": <0-100>
 }}"""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
-            
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+            return self._cached_generate(prompt, system_prompt, _parse_json_object)
                 
         except Exception as e:
             logger.error(f"Skill gap analysis failed: {e}")
         
         return {"error": "Failed to analyze skill gaps"}
     
+    async def aanalyze_skill_gaps(
+        self,
+        resume_text: str,
+        job_description: str
+    ) -> Dict[str, Any]:
+        """
+        Async variant of analyze_skill_gaps, run in the default executor.
+        
+        Args:
+            resume_text: Resume text
+            job_description: Job description text
+            
+        Returns:
+            Dictionary with skill gap analysis
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_skill_gaps, resume_text, job_description)
+    
+    def analyze_resume(
+        self,
+        resume_text: str,
+        job_description: str,
+        resume_keywords: List[str],
+        job_keywords: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Keyword matching and skill gap analysis from a single LLM call.
+        
+        Equivalent to calling match_keywords and analyze_skill_gaps, but the
+        resume and job description are sent once. If the combined response
+        cannot be parsed, the two separate calls are made instead.
+        
+        Args:
+            resume_text: Resume text
+            job_description: Job description text
+            resume_keywords: Keywords from resume
+            job_keywords: Keywords from job description
+            
+        Returns:
+            Dictionary with 'match' (as match_keywords) and 'gaps' (as analyze_skill_gaps)
+        """
+        if not self.use_llm or not self.llm_client:
+            return {
+                'match': self._basic_match_keywords(resume_keywords, job_keywords),
+                'gaps': {"error": "LLM not available for skill gap analysis"}
+            }
+        
+        try:
+            system_prompt = """You are an expert ATS keyword matcher and career advisor.
+            Match the keywords (exact, semantic, related and variation matches) and
+            analyze the skill gaps between the resume and the job description.
+            
+            Return ONLY valid JSON in this exact format:
+            {
+                "match": {
+                    "exact_matches": ["keyword1", "keyword2"],
+                    "semantic_matches": [
+                        {"job_keyword": "ML", "resume_keyword": "Machine Learning", "confidence": 0.95}
+                    ],
+                    "related_matches": [
+                        {"job_keyword": "React", "resume_keyword": "JavaScript", "relationship": "React is a JS framework", "confidence": 0.8}
+                    ],
+                    "unmatched_critical": ["keyword1", "keyword2"],
+                    "unmatched_optional": ["keyword3"],
+                    "match_analysis": "Brief analysis of match quality"
+                },
+                "gaps": {
+                    "missing_critical_skills": ["skill1", "skill2"],
+                    "missing_preferred_skills": ["skill3"],
+                    "transferable_skills": ["skill4"],
+                    "recommendations": ["recommendation1", "recommendation2"],
+                    "match_percentage": <0-100>
+                }
+            }"""
+            
+            prompt = f"""Job Keywords: {json.dumps(job_keywords)}
+Resume Keywords: {json.dumps(resume_keywords)}
+
+JOB DESCRIPTION:
+{job_description[:2000]}
+
+RESUME:
+{resume_text[:2000]}
+
+Return the keyword match and skill gap analysis in the specified JSON format."""
+            
+            result = self._cached_generate(prompt, system_prompt, _parse_combined_analysis)
+            return {
+                'match': self._add_match_rate(result['match'], job_keywords),
+                'gaps': result['gaps']
+            }
+            
+        except ValueError as e:
+            logger.warning(f"Combined analysis response was incomplete ({e}), falling back to separate calls")
+                
+        except Exception as e:
+            logger.error(f"Combined resume analysis failed: {e}")
+        
+        return {
+            'match': self.match_keywords(resume_keywords, job_keywords),
+            'gaps': self.analyze_skill_gaps(resume_text, job_description)
+        }
+    
+    def _cached_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        parse: Callable[[str], Any] = str
+    ) -> Any:
+        """
+        Generate and parse an LLM response, reusing a cached response for an identical request.
+        
+        The cache key covers the model, temperature, system prompt and prompt.
+        Hits are served from memory first, then from cache_dir on disk; entries
+        older than cache_ttl are regenerated. With near_match_threshold set, a
+        miss falls back to the response for a near-identical recent prompt.
+        
+        A response is cached only once parse accepts it, so a malformed reply
+        that sends the caller to its fallback is not replayed; a cached response
+        that no longer parses is dropped and regenerated.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            parse: Converts the response text to the caller's result; raises on
+                a malformed response (default: return the text as is)
+            
+        Returns:
+            The parsed LLM response
+            
+        Raises:
+            Whatever parse raises for a freshly generated response
+        """
+        if not self.cache_llm_responses:
+            return parse(self.llm_client.generate(prompt, system_prompt=system_prompt))
+        
+        cache_key = canonical_key(
+            str(getattr(self.llm_client, 'model', '')),
+            str(getattr(self.llm_client, 'temperature', '')),
+            system_prompt or '',
+            prompt
+        )
+        hit_key = cache_key
+        response = self._response_cache.get(cache_key)
+        
+        prompt_words = None
+        if response is None and self.near_match_threshold is not None:
+            prompt_words = frozenset(_WORD_PATTERN.findall(prompt.lower()))
+            hit_key = self._near_match_key(system_prompt or '', prompt_words)
+            response = self._response_cache.get(hit_key) if hit_key else None
+        
+        if response is not None:
+            try:
+                result = parse(response)
+            except Exception as e:
+                logger.warning(f"Dropping cached LLM response that no longer parses: {e}")
+                self._response_cache.forget(hit_key)
+            else:
+                logger.debug(f"LLM response cache hit ({hit_key[:12]})")
+                return result
+        
+        response = self.llm_client.generate(prompt, system_prompt=system_prompt)
+        # Raises before anything is cached if the response is malformed
+        result = parse(response)
+        self._response_cache.put(cache_key, response)
+        if prompt_words is not None:
+            with self._recent_prompts_lock:
+                self._recent_prompts.append((system_prompt or '', prompt_words, cache_key))
+        
+        return result
+    
+    def _near_match_key(self, system_prompt: str, words: FrozenSet[str]) -> Optional[str]:
+        """
+        Find the cache key of the most similar recent prompt under the same system prompt.
+        
+        Args:
+            system_prompt: System prompt of the request
+            words: Lowercased word set of the request prompt
+            
+        Returns:
+            Cache key of a prompt at or above near_match_threshold, or None
+        """
+        with self._recent_prompts_lock:
+            recent = list(self._recent_prompts)
+        candidates = (
+            (known_words, known_key)
+            for known_system, known_words, known_key in recent
+            if known_system == system_prompt
+        )
+        match = find_near_match(words, candidates, self.near_match_threshold)
+        if match is None:
+            return None
+        best_key, best_score = match
+        logger.info(f"Reusing LLM response for a near-identical prompt (similarity {best_score:.2f})")
+        return best_key
+    
     # Fallback methods for when LLM is not available
     def _basic_match_keywords(
         self,
@@ -353,20 +717,22 @@ Return JSON:
         unmatched_job_keywords = []
         
         resume_keywords_lower = [k.lower() for k in resume_keywords]
+        # Set for the exact-match probe; the list keeps order for the substring scan
+        resume_keyword_set = set(resume_keywords_lower)
         
         for job_keyword in job_keywords:
             job_keyword_lower = job_keyword.lower()
             
-            if job_keyword_lower in resume_keywords_lower:
+            if job_keyword_lower in resume_keyword_set:
                 exact_matches.append(job_keyword)
             else:
                 # Check for substring match
                 found = False
-                for resume_keyword in resume_keywords_lower:
+                for index, resume_keyword in enumerate(resume_keywords_lower):
                     if job_keyword_lower in resume_keyword or resume_keyword in job_keyword_lower:
                         similar_matches.append({
                             'job_keyword': job_keyword,
-                            'resume_keyword': resume_keywords[resume_keywords_lower.index(resume_keyword)]
+                            'resume_keyword': resume_keywords[index]
                         })
                         found = True
                         break
@@ -406,7 +772,7 @@ Return JSON:
                 context_snippet = text[start:end]
                 
                 # Extract potential keywords from context
-                words = re.findall(r'\b[A-Za-z]+(?:\+\+|\#)?\b', context_snippet)
+                words = _CONTEXT_WORD_PATTERN.findall(context_snippet)
                 keywords.extend(words)
         
         # Filter and deduplicate
@@ -421,35 +787,7 @@ Return JSON:
         text: str
     ) -> List[str]:
         """Basic skill variation finding without LLM."""
-        variations = []
-        skill_lower = skill.lower()
-        text_lower = text.lower()
-        
-        # Common variations patterns
-        variation_patterns = {
-            'javascript': ['js', 'node.js', 'nodejs', 'javascript', 'ecmascript'],
-            'python': ['python', 'py', 'python3', 'python2', 'cpython'],
-            'machine learning': ['ml', 'machine learning', 'deep learning', 'neural networks'],
-            'artificial intelligence': ['ai', 'artificial intelligence', 'a.i.'],
-            'database': ['db', 'database', 'sql', 'nosql', 'rdbms'],
-            'continuous integration': ['ci', 'continuous integration', 'ci/cd'],
-            'continuous deployment': ['cd', 'continuous deployment', 'ci/cd'],
-            'user experience': ['ux', 'user experience', 'ux design'],
-            'user interface': ['ui', 'user interface', 'ui design'],
-        }
-        
-        # Check if skill has known variations
-        for base_skill, variants in variation_patterns.items():
-            if base_skill in skill_lower or skill_lower in base_skill:
-                for variant in variants:
-                    if variant in text_lower:
-                        variations.append(variant)
-        
-        # Also check for direct occurrence
-        if skill_lower in text_lower:
-            variations.append(skill)
-        
-        return list(set(variations))
+        return list(_find_skill_variations(skill, text))
     
     def _basic_score_keyword_relevance(
         self,
@@ -461,13 +799,12 @@ Return JSON:
             return 50.0
         
         total_weight = sum(job_keywords.values())
-        matched_weight = 0
         
         resume_text_lower = resume_text.lower()
-        
-        for keyword, weight in job_keywords.items():
-            if keyword.lower() in resume_text_lower:
-                matched_weight += weight
+        matched_weight = sum(
+            weight for keyword, weight in job_keywords.items()
+            if keyword.lower() in resume_text_lower
+        )
         
         if total_weight > 0:
             score = (matched_weight / total_weight) * 100
@@ -1,12 +1,19 @@
 """Skill categorization utility for distinguishing hard and soft skills."""
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _skill_pattern(skill: str) -> "re.Pattern":
+    """Word-boundary pattern for a skill, compiled once per process and shared by every categorizer."""
+    return re.compile(r'\b' + re.escape(skill.lower()) + r'\b', re.IGNORECASE)
+
+
 class SkillCategorizer:
     """Categorize skills into hard skills (technical) and soft skills (non-technical)."""
     
@@ -15,6 +22,9 @@ class SkillCategorizer:
         self.soft_skills = self._load_soft_skills()
         self.hard_skill_patterns = self._compile_hard_skill_patterns()
         self.soft_skill_patterns = self._compile_soft_skill_patterns()
+        # Lowercased lookup sets for exact-match classification
+        self._hard_skill_set = frozenset(s.lower() for s in self.hard_skills)
+        self._soft_skill_set = frozenset(s.lower() for s in self.soft_skills)
     
     def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
         """
@@ -93,10 +103,10 @@ class SkillCategorizer:
             'hard', 'soft', or 'unknown'
         """
         # Check exact matches first
-        if skill in [s.lower() for s in self.hard_skills]:
+        if skill in self._hard_skill_set:
             return 'hard'
         
-        if skill in [s.lower() for s in self.soft_skills]:
+        if skill in self._soft_skill_set:
             return 'soft'
         
         # Check patterns for hard skills
@@ -121,9 +131,7 @@ class SkillCategorizer:
     def _skill_in_text(self, skill: str, text: str) -> bool:
         """Check if a skill is present in text with word boundaries."""
         # Handle skills with special characters
-        escaped_skill = re.escape(skill.lower())
-        pattern = r'\b' + escaped_skill + r'\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        return bool(_skill_pattern(skill).search(text))
     
     def _load_hard_skills(self) -> List[str]:
         """Load comprehensive list of hard skills."""
@@ -166,7 +166,8 @@ def analyze_resume(
             }
             
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+                # One write of the encoded document; json.dump issues a write per token
+                f.write(json.dumps(results, indent=2))
             
             logger.info(f"Results saved to: {output_file}")
         
@@ -21,7 +21,8 @@ class CoverLetterGenerator:
         temperature: float = 0.7,
         max_tokens: int = 2500,
         use_web_search: bool = True,
-        max_word_count: int = 280
+        max_word_count: int = 280,
+        browser=None
     ):
         """
         Initialize the cover letter generator.
@@ -34,6 +35,7 @@ class CoverLetterGenerator:
             max_tokens: Maximum tokens for LLM response
             use_web_search: Whether to use web search for company information
             max_word_count: Maximum word count for cover letter body (default: 280)
+            browser: Running Playwright browser to render PDFs in; one is launched per PDF otherwise
         """
         self.output_dir = Path(output_dir or "output/cover_letters")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -53,7 +55,8 @@ class CoverLetterGenerator:
         
         self.pdf_generator = CoverLetterPDFGenerator(
             template_file=template_file,
-            output_dir=output_dir
+            output_dir=output_dir,
+            browser=browser
         )
     
     async def generate(
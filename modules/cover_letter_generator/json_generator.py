@@ -329,7 +329,8 @@ class CoverLetterJSONGenerator:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+            # One write of the encoded document; json.dump issues a write per token
+            f.write(json.dumps(content, indent=2, ensure_ascii=False))
         
         return str(output_path)
     
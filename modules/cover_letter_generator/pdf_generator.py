@@ -15,7 +15,8 @@ class CoverLetterPDFGenerator:
     def __init__(
         self,
         template_file: str = None,
-        output_dir: str = None
+        output_dir: str = None,
+        browser=None
     ):
         """
         Initialize the PDF generator.
@@ -23,10 +24,12 @@ class CoverLetterPDFGenerator:
         Args:
             template_file: Path to HTML template
             output_dir: Directory for output PDFs
+            browser: Running Playwright browser to render in; one is launched per PDF otherwise
         """
         self.template_file = Path(template_file or Path(__file__).parent / "cover_letter_template.html")
         self.output_dir = Path(output_dir or "output/cover_letters")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.browser = browser
     
     def load_from_json(self, json_path: str) -> Dict:
         """
@@ -203,45 +206,63 @@ class CoverLetterPDFGenerator:
         """
         output_path = self.output_dir / filename
         
+        if self.browser is not None:
+            # A fresh context per PDF keeps runs isolated on the shared browser
+            context = await self.browser.new_context()
+            try:
+                await self._render_pdf(await context.new_page(), html_content, output_path)
+            finally:
+                await context.close()
+            return str(output_path)
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
-            
-            # Remove console logging for production
-            
-            # Set content and wait for JavaScript execution
-            await page.set_content(html_content, wait_until='networkidle')
-            
-            # Wait for JavaScript to execute
-            await page.wait_for_timeout(1000)
-            
-            # Verify that content was populated (silently)
-            applicant_name = await page.text_content('#applicant-name')
-            body_text = await page.text_content('#body-content')
-            
-            # Check if we have actual content or fallback
-            if applicant_name == "Your Name" or "fallback paragraph" in body_text.lower():
-                # Try to execute the population function manually
-                await page.evaluate("if (typeof coverLetterData !== 'undefined' && typeof populateCoverLetter === 'function') { populateCoverLetter(coverLetterData); }")
-                await page.wait_for_timeout(500)
-            
-            # Generate PDF with letter size and Garamond font
-            await page.pdf(
-                path=str(output_path),
-                format='Letter',
-                print_background=True,
-                margin={
-                    'top': '1in',
-                    'right': '1in',
-                    'bottom': '1in',
-                    'left': '1in'
-                }
-            )
-            
+            await self._render_pdf(page, html_content, output_path)
             await browser.close()
         
         return str(output_path)
     
+    async def _render_pdf(self, page, html_content: str, output_path: Path) -> None:
+        """
+        Render the cover letter HTML in a Playwright page and print it to output_path.
+        
+        Args:
+            page: Playwright page to render in
+            html_content: HTML content to convert
+            output_path: Destination PDF file
+        """
+        # Remove console logging for production
+        
+        # Set content and wait for JavaScript execution
+        await page.set_content(html_content, wait_until='networkidle')
+        
+        # Wait for JavaScript to execute
+        await page.wait_for_timeout(1000)
+        
+        # Verify that content was populated (silently)
+        applicant_name = await page.text_content('#applicant-name')
+        body_text = await page.text_content('#body-content')
+        
+        # Check if we have actual content or fallback
+        if applicant_name == "Your Name" or "fallback paragraph" in body_text.lower():
+            # Try to execute the population function manually
+            await page.evaluate("if (typeof coverLetterData !== 'undefined' && typeof populateCoverLetter === 'function') { populateCoverLetter(coverLetterData); }")
+            await page.wait_for_timeout(500)
+        
+        # Generate PDF with letter size and Garamond font
+        await page.pdf(
+            path=str(output_path),
+            format='Letter',
+            print_background=True,
+            margin={
+                'top': '1in',
+                'right': '1in',
+                'bottom': '1in',
+                'left': '1in'
+            }
+        )
+    
     def validate_json_structure(self, json_data: Dict) -> bool:
         """
         Validate that JSON has required structure for PDF generation.
@@ -14,16 +14,85 @@ Requirements:
 
 import json
 import os
+import sys
 import asyncio
 import re
 from pathlib import Path
 from playwright.async_api import async_playwright
 from jinja2 import Template
 from datetime import datetime
+from functools import lru_cache
+
+# Add project root to path so the shared helpers import when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.shared import json_loads
+
+# Fetch-based loadCVData function in the template, swapped for one with embedded data
+_FETCH_LOAD_FUNCTION = """        // Function to load and populate CV data
+        async function loadCVData() {
+            try {
+                // Load personal info data
+                console.log('Loading personal info...');
+                const personalResponse = await fetch('../shared/data/personal_info.json');
+                if (!personalResponse.ok) {
+                    throw new Error(`Failed to load personal info: ${personalResponse.status}`);
+                }
+                const personalData = await personalResponse.json();
+                console.log('Personal data loaded successfully');
+
+                // Try to load qualifications data (optional)
+                let qualificationsData = null;
+                try {
+                    console.log('Loading qualifications...');
+                    const qualResponse = await fetch('../shared/qualifications/qualifications.json');
+                    if (qualResponse.ok) {
+                        qualificationsData = await qualResponse.json();
+                        console.log('Qualifications loaded successfully:', qualificationsData);
+
+                        // Add target position to personal data
+                        personalData.target_position = {
+                            job_title: qualificationsData.metadata?.job_title || 'Not specified',
+                            company_name: qualificationsData.metadata?.company_name || 'Not specified',
+                            qualifications: qualificationsData.qualifications || []
+                        };
+                    } else {
+                        console.log('No qualifications file found (optional)');
+                    }
+                } catch (qualError) {
+                    console.log('Could not load qualifications (optional):', qualError.message);
+                }
+
+                // Populate the CV with combined data
+                populateCV(personalData);
+
+            } catch (error) {
+                console.error('Error loading CV data:', error);
+                document.getElementById('loading').innerHTML = `
+                    <div class="text-center">
+                        <h2 class="text-2xl font-bold text-red-600 mb-4">Error Loading CV Data</h2>
+                        <p class="text-gray-600">${error.message}</p>
+                        <p class="text-sm text-gray-500 mt-2">Please ensure the ../shared/data/personal_info.json file is accessible.</p>
+                    </div>
+                `;
+            }
+        }"""
+
+
+@lru_cache(maxsize=4)
+def _load_template_parts(template_path, file_version):
+    """Read the HTML template split around _FETCH_LOAD_FUNCTION, cached per file version"""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return tuple(f.read().split(_FETCH_LOAD_FUNCTION))
+
 
 class CVPDFGenerator:
-    def __init__(self, data_file="../shared/data/personal_info.json", template_file="ats_cv_template.html", output_dir=None):
+    def __init__(self, data_file="../shared/data/personal_info.json", template_file="ats_cv_template.html", output_dir=None, personal_data=None, browser=None):
         self.data_file = Path(data_file)
+        # Already-loaded contents of data_file, used instead of reading it again
+        self.personal_data = personal_data
+        # Running Playwright browser to render in; one is launched per PDF otherwise
+        self.browser = browser
         self.template_file = Path(template_file)
         # Use provided output_dir or default to organized structure
         if output_dir:
@@ -45,10 +114,14 @@ class CVPDFGenerator:
         return sanitized
     
     def load_personal_data(self):
-        """Load personal information from JSON file"""
+        """Load personal information from JSON file, unless it was passed in already"""
+        if self.personal_data is not None:
+            return self.personal_data
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.data_file, 'rb') as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return json_loads(raw)
         except FileNotFoundError:
             raise FileNotFoundError(f"Data file not found: {self.data_file}")
         except json.JSONDecodeError as e:
@@ -81,9 +154,9 @@ class CVPDFGenerator:
     
     def create_html_with_data(self, data, qualifications_data=None):
         """Create a complete HTML file with embedded JSON data and qualifications"""
-        # Read the original template
-        with open(self.template_file, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        # Read the original template (cached until the file changes)
+        stat = os.stat(self.template_file)
+        template_parts = _load_template_parts(str(self.template_file), (stat.st_mtime_ns, stat.st_size))
         
         # Add qualifications to data if available
         if qualifications_data:
@@ -93,55 +166,6 @@ class CVPDFGenerator:
         # Replace the fetch call with embedded data
         json_data = json.dumps(data, indent=4)
         
-        # Find and replace the loadCVData function
-        old_load_function = """        // Function to load and populate CV data
-        async function loadCVData() {
-            try {
-                // Load personal info data
-                console.log('Loading personal info...');
-                const personalResponse = await fetch('../shared/data/personal_info.json');
-                if (!personalResponse.ok) {
-                    throw new Error(`Failed to load personal info: ${personalResponse.status}`);
-                }
-                const personalData = await personalResponse.json();
-                console.log('Personal data loaded successfully');
-
-                // Try to load qualifications data (optional)
-                let qualificationsData = null;
-                try {
-                    console.log('Loading qualifications...');
-                    const qualResponse = await fetch('../shared/qualifications/qualifications.json');
-                    if (qualResponse.ok) {
-                        qualificationsData = await qualResponse.json();
-                        console.log('Qualifications loaded successfully:', qualificationsData);
-
-                        // Add target position to personal data
-                        personalData.target_position = {
-                            job_title: qualificationsData.metadata?.job_title || 'Not specified',
-                            company_name: qualificationsData.metadata?.company_name || 'Not specified',
-                            qualifications: qualificationsData.qualifications || []
-                        };
-                    } else {
-                        console.log('No qualifications file found (optional)');
-                    }
-                } catch (qualError) {
-                    console.log('Could not load qualifications (optional):', qualError.message);
-                }
-
-                // Populate the CV with combined data
-                populateCV(personalData);
-
-            } catch (error) {
-                console.error('Error loading CV data:', error);
-                document.getElementById('loading').innerHTML = `
-                    <div class="text-center">
-                        <h2 class="text-2xl font-bold text-red-600 mb-4">Error Loading CV Data</h2>
-                        <p class="text-gray-600">${error.message}</p>
-                        <p class="text-sm text-gray-500 mt-2">Please ensure the ../shared/data/personal_info.json file is accessible.</p>
-                    </div>
-                `;
-            }
-        }"""
         
         new_load_function = f"""        // Function to load and populate CV data (with embedded data)
         function loadCVData() {{
@@ -162,51 +186,58 @@ class CVPDFGenerator:
             }}
         }}"""
         
-        # Replace the function
-        modified_html = template_content.replace(old_load_function, new_load_function)
-        
-        # Also remove the async from the event listener
-        modified_html = modified_html.replace(
-            "document.addEventListener('DOMContentLoaded', loadCVData);",
-            "document.addEventListener('DOMContentLoaded', loadCVData);"
-        )
-        
-        return modified_html
+        # Replace the function; joining the pre-split template is a single copy
+        return new_load_function.join(template_parts)
     
     async def generate_pdf(self, html_content, output_filename):
         """Generate PDF from HTML content using Playwright"""
+        if self.browser is not None:
+            # A fresh context per PDF keeps runs isolated on the shared browser
+            context = await self.browser.new_context()
+            try:
+                return await self._render_pdf(await context.new_page(), html_content)
+            finally:
+                await context.close()
+        
         async with async_playwright() as p:
             # Launch browser
             browser = await p.chromium.launch()
             page = await browser.new_page()
-            
-            # Set viewport for consistent rendering
-            await page.set_viewport_size({"width": 1200, "height": 1600})
-            
-            # Set content and wait for it to load
-            await page.set_content(html_content, wait_until='networkidle')
-            
-            # Wait for the CV to be populated (increased timeout for complex data processing)
-            await page.wait_for_selector('#cv-container:not(.hidden)', timeout=30000)
-            
-            # Generate PDF with print-optimized settings
-            pdf_buffer = await page.pdf(
-                format='A4',
-                margin={
-                    'top': '0.5in',
-                    'right': '0.5in',
-                    'bottom': '0.5in',
-                    'left': '0.5in'
-                },
-                print_background=True,
-                prefer_css_page_size=True
-            )
-            
+            pdf_buffer = await self._render_pdf(page, html_content)
             await browser.close()
             return pdf_buffer
     
-    async def run(self, custom_filename=None):
-        """Main execution function"""
+    async def _render_pdf(self, page, html_content):
+        """Render the CV HTML in a Playwright page and print it to PDF bytes"""
+        # Set viewport for consistent rendering
+        await page.set_viewport_size({"width": 1200, "height": 1600})
+        
+        # Set content and wait for it to load
+        await page.set_content(html_content, wait_until='networkidle')
+        
+        # Wait for the CV to be populated (increased timeout for complex data processing)
+        await page.wait_for_selector('#cv-container:not(.hidden)', timeout=30000)
+        
+        # Generate PDF with print-optimized settings
+        pdf_buffer = await page.pdf(
+            format='A4',
+            margin={
+                'top': '0.5in',
+                'right': '0.5in',
+                'bottom': '0.5in',
+                'left': '0.5in'
+            },
+            print_background=True,
+            prefer_css_page_size=True
+        )
+        return pdf_buffer
+    
+    async def run(self, custom_filename=None, return_bytes=False):
+        """Main execution function
+        
+        Returns the saved PDF's path, or with return_bytes=True the PDF content
+        itself so callers can use it without reading the file back.
+        """
         # Load data
         data = self.load_personal_data()
         
@@ -245,6 +276,8 @@ class CVPDFGenerator:
         with open(output_path, 'wb') as f:
             f.write(pdf_buffer)
         
+        if return_bytes:
+            return pdf_buffer
         return output_path
 
 async def main():
@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from groq import Groq
 from dotenv import load_dotenv
 
@@ -52,6 +52,56 @@ class GroqClient:
         
         return response.choices[0].message.content
     
+    def generate_until(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_when: Optional[Callable[[str], bool]] = None,
+        stop_trigger: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Stream a completion and stop reading once the text so far satisfies stop_when.
+
+        Closing the stream early ends generation, so output the caller doesn't
+        need (e.g. commentary after a list) is neither waited for nor billed.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            stop_when: Called with the full text received so far; returning True
+                stops the stream. None reads the whole completion.
+            stop_trigger: Optional substring that must occur in a chunk before
+                stop_when is evaluated, so stop_when isn't re-run on every chunk.
+                Only use one that any text satisfying stop_when ends with (e.g.
+                the closing '"' of a quoted item).
+            temperature: Override the client's temperature
+            max_tokens: Override the client's max_tokens
+
+        Returns:
+            Text received up to and including the chunk that satisfied stop_when,
+            or the whole completion
+        """
+        stream = self.generate(prompt, system_prompt, temperature, max_tokens, stream=True)
+        parts = []
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Joining and testing the text so far on every chunk is quadratic; with a
+                # stop_trigger, only chunks containing it can complete the stop condition
+                if stop_trigger is not None and stop_trigger not in delta:
+                    continue
+                if stop_when is not None and stop_when("".join(parts)):
+                    break
+        finally:
+            stream.close()
+        
+        return "".join(parts)
+    
     def chat(
         self,
         messages: List[Dict[str, str]],
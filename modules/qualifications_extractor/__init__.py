@@ -16,7 +16,18 @@ HOW TO USE:
        "modules/shared/qualifications/qualifications.json"
    )
 
-4. Advanced usage:
+4. Accumulate runs as newline-delimited JSON:
+   extractor.append_qualifications_to_ndjson(qualifications)
+   history = extractor.load_qualifications_from_ndjson(
+       "modules/shared/qualifications/qualifications.ndjson"
+   )
+
+5. Several job descriptions at once (LLM calls overlap):
+   results = extractor.extract_qualifications_batch(["job1.txt", "job2.txt"])
+   # or, inside async code:
+   results = await extractor.aextract_qualifications_batch(["job1.txt", "job2.txt"])
+
+6. Advanced usage:
    matches = extractor.match_qualifications_to_requirements("job.txt")
    summary = extractor.generate_qualification_summary(qualifications)
 
@@ -1,20 +1,376 @@
 """Main qualifications extractor using LLM."""
 
+import asyncio
+import codecs
 import json
+import os
 import re
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Union
-import sys
+import time
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ..llm.groq_client import GroqClient
+from ..shared import (
+    DEFAULT_CACHE_DIR,
+    ResponseCache,
+    canonical_key,
+    find_near_match,
+    json_dumps_line as _json_dumps_line,
+    json_dumps_pretty as _json_dumps_pretty,
+    json_loads as _json_loads,
+    write_file_atomic,
+)
+from .models import Qualification, QualificationMatch, QualificationType
 
-# Add path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+logger = logging.getLogger(__name__)
 
-from modules.llm.groq_client import GroqClient
-from modules.qualifications_extractor.models import Qualification, QualificationMatch, QualificationType
+# Word tokenizer used for basic (non-LLM) qualification matching
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Patterns for years of experience ("5+ years") and degrees, compiled once at import
+_YEARS_PATTERN = re.compile(r'(\d+)\+?\s*years?', re.IGNORECASE)
+_EXPERIENCE_YEARS_PATTERN = re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', re.I)
+_EDUCATION_PATTERNS = (
+    re.compile(r"(Bachelor'?s?|Master'?s?|PhD|Ph\.D\.|MBA)\s+(?:degree\s+)?(?:in\s+)?([A-Za-z\s]+)", re.I),
+    re.compile(r"(B\.S\.|M\.S\.|B\.A\.|M\.A\.)\s+(?:in\s+)?([A-Za-z\s]+)", re.I)
+)
+
+# Quoted qualification items in an extraction response; items shorter than 5 words are noise
+_QUOTED_ITEM_PATTERN = re.compile(r'"([^"]+)"')
+_MIN_QUALIFICATION_WORDS = 5
+
+# Salvage patterns for truncated match responses: start of a match object and
+# top-level string fields
+_MATCH_OBJECT_START_PATTERN = re.compile(r'\{\s*"qualification"\s*:')
+_JOB_INFO_FIELD_PATTERN = re.compile(r'"(job_title|company_name)"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# QualificationType members by value, for loading saved qualifications without Enum.__call__
+_QUALIFICATION_TYPES_BY_VALUE = {qual_type.value: qual_type for qual_type in QualificationType}
+
+# Sort order for rank_qualifications(criteria="type"); unknown types sort last
+_TYPE_ORDER = {
+    QualificationType.EXPERIENCE: 1,
+    QualificationType.TECHNICAL_SKILL: 2,
+    QualificationType.CERTIFICATION: 3,
+    QualificationType.EDUCATION: 4,
+    QualificationType.ACHIEVEMENT: 5,
+    QualificationType.DOMAIN_KNOWLEDGE: 6,
+    QualificationType.SOFT_SKILL: 7
+}
 
-logger = logging.getLogger(__name__)
+# Read cap for job description files; prompts use at most the first 3000 characters,
+# the rest of the cap leaves room for whitespace compression and keyword matching
+_MAX_JOB_DESCRIPTION_CHARS = 16000
+
+# Longest UTF-8 encoding of a single character, for sizing capped byte reads
+_UTF8_MAX_CHAR_BYTES = 4
+
+# Re-asks (with the parse error fed back) when a match response holds no usable JSON
+_MAX_FEEDBACK_RETRIES = 2
+
+# Threads for job info requests run alongside extraction; matches the default
+# max_concurrency of aextract_qualifications_batch
+_JOB_INFO_WORKERS = 4
+
+# Whitespace runs collapsed before text is embedded in LLM prompts
+_HORIZONTAL_SPACE_PATTERN = re.compile(r'[ \t]+')
+_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+# Skills probed by basic extraction, job-specific stack first, then common skills
+_BASIC_SKILL_KEYWORDS = (
+    'react', 'node.js', 'typescript', 'javascript', 'mongodb', 'postgresql',
+    'python', 'java', 'docker', 'kubernetes', 'aws', 'azure', 'sql', 'api', 'agile', 'scrum'
+)
+
+# Qualification text emitted for a matched skill ({name} is the capitalized skill)
+_SKILL_QUALIFICATION_TEXTS = {
+    'react': "React Frontend Development Expertise",
+    'node.js': "Node.js Backend Development Experience",
+    'typescript': "TypeScript Development Proficiency",
+    'javascript': "JavaScript Full Stack Development",
+    'mongodb': "MongoDB Database Management Experience",
+    'postgresql': "PostgreSQL Database Design Skills",
+    'python': "{name} Programming Expertise",
+    'java': "{name} Programming Expertise",
+    'docker': "{name} Container Orchestration",
+    'kubernetes': "{name} Container Orchestration",
+    'aws': "{name} Cloud Platform Experience",
+    'azure': "{name} Cloud Platform Experience",
+    'api': "RESTful API Design & Integration",
+    'agile': "{name} Software Development Methodology",
+    'scrum': "{name} Software Development Methodology",
+}
+
+
+@lru_cache(maxsize=32)
+def _skill_hits(text_lower: bytes) -> FrozenSet[str]:
+    """
+    Find which basic skills a document mentions, cached per document.
+
+    Args:
+        text_lower: Lowercased ASCII bytes of a job description or resume
+
+    Returns:
+        Skills from _BASIC_SKILL_KEYWORDS contained in the text
+    """
+    return frozenset(skill for skill in _BASIC_SKILL_KEYWORDS if skill.encode('ascii') in text_lower)
+
+
+def _extract_json_blob(text: str, start: int = 0) -> Optional[str]:
+    """
+    Find the outermost JSON object in an LLM response with a single brace-depth scan.
+
+    Braces inside JSON strings (including escaped quotes) are ignored.
+
+    Args:
+        text: Raw LLM response
+        start: Index to start searching for the opening '{'
+
+    Returns:
+        Slice from the first '{' to its matching '}', or None if there is none
+    """
+    start = text.find('{', start)
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return None
+
+
+def _compress_text(text: str) -> str:
+    """
+    Collapse redundant whitespace so more content fits in the prompt character budget.
+
+    Runs of spaces/tabs become one space and three or more newlines become a
+    single blank line.
+
+    Args:
+        text: Text to compress
+
+    Returns:
+        Compressed, stripped text
+    """
+    text = _HORIZONTAL_SPACE_PATTERN.sub(' ', text)
+    return _BLANK_LINES_PATTERN.sub('\n\n', text).strip()
+
+
+def _truncate_text(text: str, max_chars: int) -> str:
+    """
+    Cut text to at most max_chars, backing off to the last whitespace.
+
+    A plain slice can end mid-word, spending tokens on a fragment the model
+    cannot use. The cut only backs off within the last 10% of the budget, so
+    a long unbroken run is still sliced hard.
+
+    Args:
+        text: Text to truncate
+        max_chars: Character budget
+
+    Returns:
+        The text itself if it fits, otherwise its truncated prefix
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(' ', max_chars - max_chars // 10, max_chars + 1)
+    newline = text.rfind('\n', max_chars - max_chars // 10, max_chars + 1)
+    cut = max(cut, newline)
+    return text[:cut if cut > 0 else max_chars].rstrip()
+
+
+def _count_quoted_qualifications(text: str) -> int:
+    """
+    Count the complete, usable quoted qualification items in a (partial) response.
+
+    Applies the same filter as the first parsing strategy in _extract_all, so a
+    response cut off once this reaches num_quals parses to the same result.
+
+    Args:
+        text: Response text so far
+
+    Returns:
+        Number of valid quoted items
+    """
+    count = 0
+    for match in _QUOTED_ITEM_PATTERN.findall(text):
+        cleaned = match.strip()
+        if len(cleaned) > 10 and len(cleaned.split()) >= _MIN_QUALIFICATION_WORDS:
+            count += 1
+    return count
+
+
+@lru_cache(maxsize=4)
+def _read_prompt_file(prompt_path: str, file_version: Tuple[int, int]) -> str:
+    """
+    Read a prompt file, cached per file version so repeat extractions skip the read.
+
+    Args:
+        prompt_path: Path to the prompt markdown file
+        file_version: (st_mtime_ns, st_size) of the file, part of the cache key
+
+    Returns:
+        Stripped prompt text
+    """
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+@lru_cache(maxsize=16)
+def _read_personal_info_text(personal_info_path: str, file_version: Tuple[int, int]) -> str:
+    """
+    Read personal_info.json and render it as resume-like text.
+
+    Cached per file version so repeated calls skip the JSON parse and rendering.
+    Whitespace is compressed since the text is embedded in LLM prompts.
+
+    Args:
+        personal_info_path: Path to personal_info.json file
+        file_version: (st_mtime_ns, st_size) of the file, part of the cache key
+
+    Returns:
+        Formatted text representation of personal info
+    """
+    try:
+        with open(personal_info_path, 'rb', buffering=65536) as file:
+            data = _json_loads(file.read())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Personal info file not found: {personal_info_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in personal info file: {e}")
+    
+    # Convert personal_info.json to resume-like text
+    parts = []
+    add = parts.append
+    
+    # Personal Information
+    personal_info = data.get('personal_info', {})
+    for label, key, default in (
+        ('Name', 'name', 'Unknown'),
+        ('Title', 'job_title', 'Professional'),
+        ('Email', 'email', ''),
+        ('Phone', 'mobile', '')
+    ):
+        add(f"{label}: {personal_info.get(key, default)}")
+    
+    # Work Information
+    work_info = data.get('work_info', {})
+    
+    # Summary
+    summary = work_info.get('summary', '')
+    if summary:
+        add(f"\nPROFESSIONAL SUMMARY:\n{summary}")
+    
+    # Experience
+    experience = work_info.get('experience', [])
+    if experience:
+        add("\nWORK EXPERIENCE:")
+        for exp in experience:
+            add(f"\n{exp.get('role', 'Unknown Role')} at {exp.get('company', 'Unknown Company')}")
+            add(f"Location: {exp.get('location', '')}")
+            add(f"Period: {exp.get('period', '')}")
+            
+            features = exp.get('features', [])
+            if features:
+                add('\n'.join(f"• {feature}" for feature in features))
+    
+    # Skills (hard and soft share the same category layout)
+    skills = work_info.get('skills', {})
+    for heading, key in (("\nTECHNICAL SKILLS:", 'hard_skills'), ("\nSOFT SKILLS:", 'soft_skills')):
+        skill_categories = skills.get(key, [])
+        if skill_categories:
+            add(heading)
+            for skill_category in skill_categories:
+                skill_list = skill_category.get('skill_list', [])
+                if skill_list:
+                    add(f"{skill_category.get('category', '')}: {', '.join(skill_list)}")
+    
+    # Education
+    education = data.get('education', {})
+    if education:
+        add("\nEDUCATION:")
+        add(f"{education.get('degree', '')}")
+        add(f"{education.get('school_location', '')} ({education.get('period', '')})")
+    
+    # Certifications
+    certifications = data.get('certifications', [])
+    if certifications:
+        add("\nCERTIFICATIONS:")
+        add('\n'.join(
+            f"• {cert.get('certification_name', '')} - "
+            f"{cert.get('certification_provider', '')} ({cert.get('certification_date', '')})"
+            for cert in certifications
+        ))
+    
+    # Other interests
+    other = data.get('other', {})
+    interests = other.get('interest_and_hobbies', [])
+    if interests:
+        add("\nINTERESTS:")
+        add('\n'.join(
+            f"{interest.get('title', '')}: {interest.get('content', '')}"
+            for interest in interests
+        ))
+    
+    return _compress_text('\n'.join(parts))
+
+
+@lru_cache(maxsize=16)
+def _read_job_description(job_description_path: str, file_version: Tuple[int, int], max_chars: int) -> str:
+    """
+    Read a job description file, cached per file version, with whitespace compressed.
+
+    The file is read in binary mode with one read sized from fstat and capped at
+    the most bytes max_chars characters can take, so oversized files are never
+    fully materialized; newlines are only translated when the text contains \r.
+
+    Args:
+        job_description_path: Path to job description text file
+        file_version: (st_mtime_ns, st_size) of the file, part of the cache key
+        max_chars: Maximum number of characters to read
+
+    Returns:
+        Job description text
+    """
+    try:
+        with open(job_description_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            raw = file.read(min(size, max_chars * _UTF8_MAX_CHAR_BYTES))
+        # A capped read can split a multi-byte character; the incremental decoder drops the partial tail
+        text = codecs.getincrementaldecoder('utf-8')().decode(raw, final=len(raw) >= size)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        content = _compress_text(text[:max_chars])
+        if not content:
+            raise ValueError("Job description file is empty")
+        return content
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Job description file not found: {job_description_path}")
+    except Exception as e:
+        raise ValueError(f"Error reading job description file: {e}")
 
 
 class QualificationsExtractor:
@@ -27,7 +383,11 @@ class QualificationsExtractor:
         temperature: float = 0.1,  # Lower temperature for more consistent output
         max_tokens: int = 2000,
         auto_save: bool = True,
-        output_dir: str = "modules/shared/qualifications"
+        output_dir: str = "modules/shared/qualifications",
+        cache_llm_responses: bool = True,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 86400.0,
+        near_match_threshold: Optional[float] = None
     ):
         """
         Initialize the qualifications extractor.
@@ -39,11 +399,34 @@ class QualificationsExtractor:
             max_tokens: Maximum tokens for LLM response
             auto_save: Whether to automatically save extracted qualifications to JSON
             output_dir: Directory to save qualification JSON files
+            cache_llm_responses: Whether to reuse LLM responses for identical prompts
+            cache_dir: Directory for the on-disk LLM response cache (default: modules/shared/cache/llm)
+            cache_ttl: Seconds a cached LLM response stays valid (default: 24 hours)
+            near_match_threshold: Reuse cached results for a previously seen job description
+                whose word-set similarity is at least this (e.g. 0.95); None disables
         """
         self.num_qualifications = num_qualifications
         self.use_llm = use_llm
         self.auto_save = auto_save
         self.output_dir = Path(output_dir)
+        # One timestamp per extractor run so qualifications and matches saved together agree
+        self._run_timestamp = datetime.now().isoformat()
+        # Metadata of the most recent JSON save, so callers needn't re-read the file
+        self.last_metadata: Optional[Dict[str, Any]] = None
+        # Combined LLM results keyed by (resume_text, job_description, num_quals)
+        self._extraction_cache: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        # Parsed _extract_job_info results keyed by blake2b digest of the job description
+        self._job_info_cache: Dict[bytes, Dict[str, Optional[str]]] = {}
+        # Runs _extract_job_info alongside the main extraction prompt; threads start on first use
+        self._job_info_executor = ThreadPoolExecutor(max_workers=_JOB_INFO_WORKERS, thread_name_prefix="job-info")
+        # LLM response cache: in-memory tier in front of one JSON file per prompt in cache_dir
+        self.cache_llm_responses = cache_llm_responses
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.cache_ttl = cache_ttl
+        self._response_cache = ResponseCache(self.cache_dir, cache_ttl)
+        # Near-match tier: word sets of previously seen job descriptions, loaded lazily
+        self.near_match_threshold = near_match_threshold
+        self._known_job_descriptions: Optional[List[Tuple[FrozenSet[str], str]]] = None
         
         if self.use_llm:
             try:
@@ -71,9 +454,10 @@ class QualificationsExtractor:
             System prompt string
         """
         try:
-            if self.prompt_file.exists():
-                with open(self.prompt_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
+            # One stat serves as both the existence check and the cache version
+            version = self._file_version(str(self.prompt_file))
+            if version != (0, 0):
+                content = _read_prompt_file(str(self.prompt_file), version)
                 
                 if content:
                     logger.debug(f"Loaded prompt from {self.prompt_file}")
@@ -122,6 +506,7 @@ class QualificationsExtractor:
         # Extract job info if job description path provided
         job_title = "Full-stack Engineer"
         company_name = ""
+        job_description = None
         
         if job_description_path and job_description_path != "default":
             try:
@@ -141,7 +526,8 @@ class QualificationsExtractor:
             job_description_path=job_description_path or "default",
             output_filename="qualifications.json",
             job_title=job_title,
-            company_name=company_name
+            company_name=company_name,
+            job_description=job_description
         )
 
         return qualifications
@@ -212,43 +598,136 @@ Structure each qualification as:
             job_title: Job title for the position
             company_name: Company name for the position
             
+        Returns:
+            List of Qualification objects
+        """
+        try:
+            job_description = self._load_job_description(job_description_path)
+        except Exception as e:
+            logger.error(f"Failed to load files: {e}")
+            raise ValueError(f"Could not load required files: {e}")
+        
+        return self._extract_qualifications_for_description(
+            job_description,
+            job_description_path,
+            num_qualifications,
+            personal_info_path,
+            save_to_json,
+            output_filename,
+            job_title,
+            company_name
+        )
+    
+    def extract_qualifications_from_text(
+        self,
+        job_description_text: str,
+        num_qualifications: Optional[int] = None,
+        personal_info_path: str = "modules/shared/data/personal_info.json",
+        save_to_json: Optional[bool] = None,
+        output_filename: Optional[str] = None,
+        job_title: Optional[str] = None,
+        company_name: Optional[str] = None
+    ) -> List[Qualification]:
+        """
+        Extract key qualifications from personal_info.json that match a job description given as text.
+        
+        Same as extract_qualifications, without a job description file on disk.
+        
+        Args:
+            job_description_text: Job description text
+            num_qualifications: Override default number of qualifications
+            personal_info_path: Path to personal_info.json file
+            save_to_json: Override auto_save setting for this extraction
+            output_filename: Custom filename for JSON output (default: qualifications.json)
+            job_title: Job title for the position
+            company_name: Company name for the position
+            
+        Returns:
+            List of Qualification objects
+        """
+        job_description = _compress_text(job_description_text[:_MAX_JOB_DESCRIPTION_CHARS])
+        if not job_description:
+            raise ValueError("Job description text is empty")
+        
+        return self._extract_qualifications_for_description(
+            job_description,
+            None,
+            num_qualifications,
+            personal_info_path,
+            save_to_json,
+            output_filename,
+            job_title,
+            company_name
+        )
+    
+    def _extract_qualifications_for_description(
+        self,
+        job_description: str,
+        job_description_path: Optional[str],
+        num_qualifications: Optional[int],
+        personal_info_path: str,
+        save_to_json: Optional[bool],
+        output_filename: Optional[str],
+        job_title: Optional[str],
+        company_name: Optional[str]
+    ) -> List[Qualification]:
+        """
+        Run extract_qualifications on an already loaded job description.
+        
+        Args:
+            job_description: Job description text
+            job_description_path: Path the text was loaded from (used for metadata), or None
+            
+            The remaining arguments are as for extract_qualifications.
+            
         Returns:
             List of Qualification objects
         """
         num_quals = num_qualifications or self.num_qualifications
         should_save = save_to_json if save_to_json is not None else self.auto_save
         
-        # Load personal info and job description
+        # Load personal info
         try:
             resume_text = self._load_personal_info_as_text(personal_info_path)
-            job_description = self._load_job_description(job_description_path)
         except Exception as e:
             logger.error(f"Failed to load files: {e}")
             raise ValueError(f"Could not load required files: {e}")
         
-        # Extract job title and company from job description if not provided
-        if (job_title is None or company_name is None) and (self.use_llm and self.llm_client):
-            extracted_info = self._extract_job_info(job_description)
+        if self.use_llm and self.llm_client:
+            job_description = self._canonical_job_description(job_description)
+        
+        # A match run on the same inputs already extracted the job title and company;
+        # its qualifications come from a different prompt, so only those are reused
+        cached = self._extraction_cache.get((resume_text, job_description, num_quals))
+        if cached:
             if job_title is None:
-                job_title = extracted_info.get('job_title')
+                job_title = cached['job_title']
             if company_name is None:
-                company_name = extracted_info.get('company_name')
+                company_name = cached['company_name']
         
         if not self.use_llm or not self.llm_client:
             return self._extract_basic_qualifications(resume_text, job_description, num_quals)
         
+        # Extract job title and company from job description if not provided and the
+        # result will be saved; the call is independent of the main extraction, so it
+        # runs alongside it
+        job_info_future = None
+        if should_save and (job_title is None or company_name is None):
+            job_info_future = self._job_info_executor.submit(self._extract_job_info, job_description)
+        
         try:
             # Load system prompt from MD file (the entire prompt.md file)
             system_prompt = self._load_prompt()
             
-            # Create user prompt with the actual data
+            # Create user prompt with the actual data; the applicant profile comes first so
+            # the prompt prefix is identical across jobs and provider prefix caching can reuse it
             prompt = f"""Here is the data to analyze:
 
-JOB DESCRIPTION (job.txt):
-{job_description[:3000]}
-
 APPLICANT PROFILE (personal_info.json):
-{resume_text[:4000]}
+{_truncate_text(resume_text, 4000)}
+
+JOB DESCRIPTION (job.txt):
+{_truncate_text(job_description, 3000)}
 
 Based on the instructions in the system prompt, extract exactly 4 qualifications that best match this job description.
 
@@ -263,7 +742,9 @@ Example output format:
 "Solid grasp on technical triage, debt, & ownership; proven ability to lead on tasks and guide colleagues"
 """
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
+            # Stream the response and stop once num_quals usable items have arrived;
+            # the model often keeps writing commentary after the list
+            response = self._cached_generate(prompt, system_prompt, stop_after_quotes=num_quals)
             # Parse the response which should be in the format:
             # "Qualification Item"
             qualifications = []
@@ -273,15 +754,14 @@ Example output format:
 
             # Try multiple parsing strategies
             # Strategy 1: Look for pattern: "Qualification Item" (text within double quotes)
-            pattern = r'"([^"]+)"'
-            matches = re.findall(pattern, response)
+            matches = _QUOTED_ITEM_PATTERN.findall(response)
             
             # Filter out empty or invalid matches
             valid_matches = []
             for match in matches:
                 cleaned = match.strip()
                 # Skip empty strings, single characters, or strings that are too short (must be > 10 words per prompt)
-                if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= 5:
+                if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= _MIN_QUALIFICATION_WORDS:
                     valid_matches.append(cleaned)
             
             # Strategy 2: If we don't have enough matches, try looking for lines between markdown code blocks
@@ -297,7 +777,7 @@ Example output format:
                         line_quotes = re.findall(r'"([^"]+)"', line)
                         for quote in line_quotes:
                             cleaned = quote.strip()
-                            if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= 5 and cleaned not in valid_matches:
+                            if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= _MIN_QUALIFICATION_WORDS and cleaned not in valid_matches:
                                 valid_matches.append(cleaned)
 
             # Strategy 3: If still not enough, look for standalone quoted lines
@@ -311,7 +791,7 @@ Example output format:
                     # Check if the entire line is a quoted string
                     if line.startswith('"') and line.endswith('"'):
                         cleaned = line.strip('"').strip()
-                        if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= 5 and cleaned not in valid_matches:
+                        if cleaned and len(cleaned) > 10 and len(cleaned.split()) >= _MIN_QUALIFICATION_WORDS and cleaned not in valid_matches:
                             valid_matches.append(cleaned)
             
             # Create qualifications from valid matches
@@ -352,23 +832,28 @@ Example output format:
 
                 logger.info(f"Adding {needed_count} default qualifications to reach target of {num_quals}")
 
-                # Add default qualifications, avoiding duplicates
+                # Add default qualifications, avoiding duplicates; word sets of
+                # accepted qualifications are built once rather than per pair
+                existing_word_sets = [set(q.text.lower().split()) for q in qualifications]
+                min_existing_score = min(q.relevance_score for q in qualifications)
                 for default_qual in default_qualifications:
                     if needed_count <= 0:
                         break
 
                     # Check if similar qualification already exists
+                    default_words = set(default_qual.text.lower().split())
                     is_duplicate = any(
-                        self._qualifications_similar(default_qual.text, existing.text)
-                        for existing in qualifications
+                        self._word_sets_similar(default_words, existing_words)
+                        for existing_words in existing_word_sets
                     )
 
                     if not is_duplicate:
                         # Adjust relevance score to be lower than existing ones
-                        min_existing_score = min(q.relevance_score for q in qualifications) if qualifications else 90.0
                         default_qual.relevance_score = min(default_qual.relevance_score, min_existing_score - 5.0)
+                        min_existing_score = min(min_existing_score, default_qual.relevance_score)
 
                         qualifications.append(default_qual)
+                        existing_word_sets.append(default_words)
                         needed_count -= 1
                         logger.info(f"Added default qualification: {default_qual.text}")
 
@@ -385,12 +870,14 @@ Example output format:
 
             # Save to JSON if requested
             if should_save and qualifications:
+                job_title, company_name = self._resolve_job_info(job_info_future, job_title, company_name)
                 self._save_qualifications_to_json(
                     qualifications,
                     job_description_path,
                     output_filename,
                     job_title,
-                    company_name
+                    company_name,
+                    job_description
                 )
             return qualifications if qualifications else self._extract_basic_qualifications(resume_text, job_description, num_quals)
                 
@@ -400,16 +887,117 @@ Example output format:
         qualifications = self._extract_basic_qualifications(resume_text, job_description, num_quals)
         # Save to JSON if requested
         if should_save:
+            job_title, company_name = self._resolve_job_info(job_info_future, job_title, company_name)
             self._save_qualifications_to_json(
                 qualifications,
                 job_description_path,
                 output_filename,
                 job_title,
-                company_name
+                company_name,
+                job_description
             )
 
         return qualifications
     
+    def _resolve_job_info(
+        self,
+        job_info_future: Optional[Future],
+        job_title: Optional[str],
+        company_name: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fill in job title and company name from a pending _extract_job_info call.
+        
+        Args:
+            job_info_future: Future for _extract_job_info, or None if it was not needed
+            job_title: Job title given by the caller, if any
+            company_name: Company name given by the caller, if any
+            
+        Returns:
+            Tuple of (job_title, company_name)
+        """
+        if job_info_future is not None:
+            extracted_info = job_info_future.result()
+            if job_title is None:
+                job_title = extracted_info.get('job_title')
+            if company_name is None:
+                company_name = extracted_info.get('company_name')
+        return job_title, company_name
+    
+    async def aextract_qualifications(
+        self,
+        job_description_path: str,
+        **kwargs
+    ) -> List[Qualification]:
+        """
+        Async variant of extract_qualifications.
+        
+        The blocking extraction runs in the default executor, so several
+        extractions awaited together overlap their LLM round trips.
+        
+        Args:
+            job_description_path: Path to job description text file
+            **kwargs: Same keyword arguments as extract_qualifications
+            
+        Returns:
+            List of Qualification objects
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.extract_qualifications, job_description_path, **kwargs)
+        )
+    
+    async def aextract_qualifications_batch(
+        self,
+        job_description_paths: List[str],
+        max_concurrency: int = 4,
+        **kwargs
+    ) -> List[List[Qualification]]:
+        """
+        Extract qualifications for several job descriptions concurrently.
+        
+        Each job is saved to "<job file stem>_qualifications.json" unless
+        output_filename is passed explicitly.
+        
+        Args:
+            job_description_paths: Paths to job description text files
+            max_concurrency: Maximum number of extractions in flight (LLM rate limit)
+            **kwargs: Same keyword arguments as extract_qualifications
+            
+        Returns:
+            List of qualification lists, in the same order as job_description_paths
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def extract_one(job_description_path: str) -> List[Qualification]:
+            job_kwargs = dict(kwargs)
+            job_kwargs.setdefault('output_filename', f"{Path(job_description_path).stem}_qualifications.json")
+            async with semaphore:
+                return await self.aextract_qualifications(job_description_path, **job_kwargs)
+        
+        return await asyncio.gather(*(extract_one(path) for path in job_description_paths))
+    
+    def extract_qualifications_batch(
+        self,
+        job_description_paths: List[str],
+        max_concurrency: int = 4,
+        **kwargs
+    ) -> List[List[Qualification]]:
+        """
+        Synchronous wrapper around aextract_qualifications_batch.
+        
+        Args:
+            job_description_paths: Paths to job description text files
+            max_concurrency: Maximum number of extractions in flight (LLM rate limit)
+            **kwargs: Same keyword arguments as extract_qualifications
+            
+        Returns:
+            List of qualification lists, in the same order as job_description_paths
+        """
+        return asyncio.run(
+            self.aextract_qualifications_batch(job_description_paths, max_concurrency, **kwargs)
+        )
+    
     def format_qualifications_list(
         self,
         qualifications: List[Qualification],
@@ -468,34 +1056,203 @@ Example output format:
             job_title: Job title for the position
             company_name: Company name for the position
             
+        Returns:
+            List of QualificationMatch objects
+        """
+        try:
+            job_description = self._load_job_description(job_description_path)
+        except Exception as e:
+            logger.error(f"Failed to load files: {e}")
+            raise ValueError(f"Could not load required files: {e}")
+        
+        return self._match_qualifications_for_description(
+            job_description,
+            job_description_path,
+            num_qualifications,
+            personal_info_path,
+            save_to_json,
+            output_filename,
+            job_title,
+            company_name
+        )
+    
+    def match_qualifications_from_text(
+        self,
+        job_description_text: str,
+        num_qualifications: Optional[int] = None,
+        personal_info_path: str = "modules/shared/data/personal_info.json",
+        save_to_json: Optional[bool] = None,
+        output_filename: Optional[str] = None,
+        job_title: Optional[str] = None,
+        company_name: Optional[str] = None
+    ) -> List[QualificationMatch]:
+        """
+        Extract qualifications and match them to job requirements given as text.
+        
+        Same as match_qualifications_to_requirements, without a job description file on disk.
+        
+        Args:
+            job_description_text: Job description text
+            num_qualifications: Override default number of qualifications
+            personal_info_path: Path to personal_info.json file
+            save_to_json: Override auto_save setting for this extraction
+            output_filename: Custom filename for JSON output (default: qualification_matches.json)
+            job_title: Job title for the position
+            company_name: Company name for the position
+            
+        Returns:
+            List of QualificationMatch objects
+        """
+        job_description = _compress_text(job_description_text[:_MAX_JOB_DESCRIPTION_CHARS])
+        if not job_description:
+            raise ValueError("Job description text is empty")
+        
+        return self._match_qualifications_for_description(
+            job_description,
+            None,
+            num_qualifications,
+            personal_info_path,
+            save_to_json,
+            output_filename,
+            job_title,
+            company_name
+        )
+    
+    def _match_qualifications_for_description(
+        self,
+        job_description: str,
+        job_description_path: Optional[str],
+        num_qualifications: Optional[int],
+        personal_info_path: str,
+        save_to_json: Optional[bool],
+        output_filename: Optional[str],
+        job_title: Optional[str],
+        company_name: Optional[str]
+    ) -> List[QualificationMatch]:
+        """
+        Run match_qualifications_to_requirements on an already loaded job description.
+        
+        Args:
+            job_description: Job description text
+            job_description_path: Path the text was loaded from (used for metadata), or None
+            
+            The remaining arguments are as for match_qualifications_to_requirements.
+            
         Returns:
             List of QualificationMatch objects
         """
         num_quals = num_qualifications or self.num_qualifications
+        should_save = save_to_json if save_to_json is not None else self.auto_save
         
-        # Load personal info and job description
+        # Load personal info
         try:
             resume_text = self._load_personal_info_as_text(personal_info_path)
-            job_description = self._load_job_description(job_description_path)
         except Exception as e:
             logger.error(f"Failed to load files: {e}")
             raise ValueError(f"Could not load required files: {e}")
         
+        if self.use_llm and self.llm_client:
+            job_description = self._canonical_job_description(job_description)
+        
+        if not self.use_llm or not self.llm_client:
+            qualifications = self._extract_basic_qualifications(resume_text, job_description, num_quals)
+            job_index = self._index_job_lines(job_description)
+            return [self._create_basic_match(qual, job_description, job_index) for qual in qualifications]
+        
+        try:
+            # One LLM call returns job info and matches together
+            result = self._extract_all(job_description, resume_text, num_quals)
+            if result:
+                if job_title is None:
+                    job_title = result['job_title']
+                if company_name is None:
+                    company_name = result['company_name']
+                matches = result['matches']
+                
+                # Log final qualification matches
+                logger.info(f"Final qualification matches ({len(matches)}):")
+                for i, match in enumerate(matches, 1):
+                    logger.info(f"  {i}. {match.qualification.text}")
+                    logger.info(f"      -> Matches: {match.job_requirement[:50]}...")
+                    logger.info(f"      -> Strength: {match.match_strength}")
+
+                # Save to JSON if requested
+                if should_save:
+                    self._save_matches_to_json(
+                        matches,
+                        job_description_path,
+                        output_filename,
+                        job_title,
+                        company_name,
+                        job_description
+                    )
+
+                return matches
+                
+        except Exception as e:
+            logger.error(f"LLM matching failed: {e}")
+        
         # Extract job title and company from job description if not provided
-        if (job_title is None or company_name is None) and (self.use_llm and self.llm_client):
+        if job_title is None or company_name is None:
             extracted_info = self._extract_job_info(job_description)
             if job_title is None:
                 job_title = extracted_info.get('job_title')
             if company_name is None:
                 company_name = extracted_info.get('company_name')
         
-        if not self.use_llm or not self.llm_client:
-            qualifications = self._extract_basic_qualifications(resume_text, job_description, num_quals)
-            return [self._create_basic_match(qual, job_description) for qual in qualifications]
+        # Fallback
+        qualifications = self._extract_basic_qualifications(resume_text, job_description, num_quals)
+        job_index = self._index_job_lines(job_description)
+        matches = [self._create_basic_match(qual, job_description, job_index) for qual in qualifications]
+
+        # Log final qualification matches from fallback
+        logger.info(f"Final qualification matches from fallback ({len(matches)}):")
+        for i, match in enumerate(matches, 1):
+            logger.info(f"  {i}. {match.qualification.text}")
+            logger.info(f"      -> Matches: {match.job_requirement[:50]}...")
+            logger.info(f"      -> Strength: {match.match_strength}")
+
+        # Save to JSON if requested
+        if should_save:
+            self._save_matches_to_json(
+                matches,
+                job_description_path,
+                output_filename,
+                job_title,
+                company_name,
+                job_description
+            )
+
+        return matches
+    
+    def _extract_all(
+        self,
+        job_description: str,
+        resume_text: str,
+        num_quals: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract job info and qualification matches with a single LLM call.
         
-        try:
-            # For matching, use a specific prompt instead of the extraction prompt
-            system_prompt = """You are an expert recruiter matching candidate qualifications to job requirements.
+        Results are memoized per (resume_text, job_description, num_quals), so a
+        repeat match run is free and extract_qualifications can reuse the job
+        title and company name.
+        
+        Args:
+            job_description: Job description text
+            resume_text: Resume text built from personal_info.json
+            num_quals: Number of qualifications to match
+            
+        Returns:
+            Dictionary with 'job_title', 'company_name' and 'matches' keys,
+            or None if the response contained no JSON
+        """
+        cache_key = (resume_text, job_description, num_quals)
+        if cache_key in self._extraction_cache:
+            return self._extraction_cache[cache_key]
+        
+        # For matching, use a specific prompt instead of the extraction prompt
+        system_prompt = """You are an expert recruiter matching candidate qualifications to job requirements.
 Analyze how well each qualification meets specific job requirements.
 
 CRITICAL RULES:
@@ -504,12 +1261,14 @@ CRITICAL RULES:
 3. When referencing projects or work achievements, ONLY use information from "work_info.experience" section.
 4. Avoid generic phrases like "proficient in", "skilled in", "experienced with".
 5. Create specific, contextual qualifications that demonstrate practical application from actual work experience."""
+        
+        # Append JSON format requirement
+        system_prompt += """
             
-            # Append JSON format requirement
-            system_prompt += """
-            
-Return ONLY valid JSON in this format:
+Return ONLY valid JSON in this format (use null for job_title or company_name if not found):
 {
+    "job_title": "Exact job title from the job description",
+    "company_name": "Company name from the job description",
     "matches": [
         {
             "qualification": {
@@ -525,14 +1284,15 @@ Return ONLY valid JSON in this format:
         }
     ]
 }"""
-            
-            prompt = f"""Match {num_quals} KEY QUALIFICATIONS from the resume to specific job requirements.
-
-JOB DESCRIPTION:
-{job_description[:2000]}
+        
+        # Resume before job description keeps the prompt prefix stable across jobs
+        prompt = f"""Match {num_quals} KEY QUALIFICATIONS from the resume to specific job requirements.
 
 RESUME:
-{resume_text[:3000]}
+{_truncate_text(resume_text, 3000)}
+
+JOB DESCRIPTION:
+{_truncate_text(job_description, 2000)}
 
 Instructions for DIVERSE QUALIFICATIONS:
 1. Extract {num_quals} qualifications from DIFFERENT projects/roles/companies
@@ -550,105 +1310,126 @@ DIVERSITY CHECKLIST:
 - Is there a mix of technical and soft skills? ✓
 - Are different time periods represented? ✓
 
+Also extract the exact job title and the company name from the job description.
+
 Return as JSON with the specified format."""
-            
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
+        
+        request_prompt = prompt
+        for attempt in range(_MAX_FEEDBACK_RETRIES + 1):
+            response = self._cached_generate(request_prompt, system_prompt)
             
             # Parse JSON response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                matches = []
-                
-                for match_data in data.get('matches', [])[:num_quals]:
-                    qual_data = match_data.get('qualification', {})
-                    
-                    # Map type string to enum value, with fallback and compatibility
-                    type_str = qual_data.get('type', 'experience').lower()
-                    
-                    # Handle common variations and misnamed types
-                    type_mapping = {
-                        'skill': 'technical_skill',
-                        'technical': 'technical_skill',
-                        'soft': 'soft_skill',
-                        'exp': 'experience',
-                        'edu': 'education',
-                        'cert': 'certification',
-                        'achieve': 'achievement',
-                        'domain': 'domain_knowledge',
-                        'methodology': 'domain_knowledge'
-                    }
-                    
-                    type_str = type_mapping.get(type_str, type_str)
-                    
-                    try:
-                        qual_type = QualificationType(type_str)
-                    except ValueError:
-                        logger.warning(f"Invalid qualification type: {type_str}, defaulting to experience")
-                        qual_type = QualificationType.EXPERIENCE
-                    
-                    qualification = Qualification(
-                        text=qual_data.get('text', ''),
-                        type=qual_type,
-                        relevance_score=float(qual_data.get('relevance_score', 0)),
-                        evidence=qual_data.get('evidence'),
-                        years_experience=qual_data.get('years_experience')
-                    )
-                    
-                    match = QualificationMatch(
-                        qualification=qualification,
-                        job_requirement=match_data.get('job_requirement', ''),
-                        match_strength=match_data.get('match_strength', 'moderate'),
-                        explanation=match_data.get('explanation', '')
-                    )
-                    matches.append(match)
-                
-                # Log final qualification matches
-                logger.info(f"Final qualification matches ({len(matches)}):")
-                for i, match in enumerate(matches, 1):
-                    logger.info(f"  {i}. {match.qualification.text}")
-                    logger.info(f"      -> Matches: {match.job_requirement[:50]}...")
-                    logger.info(f"      -> Strength: {match.match_strength}")
-
-                # Save to JSON if requested
-                should_save = save_to_json if save_to_json is not None else self.auto_save
-                if should_save:
-                    self._save_matches_to_json(
-                        matches,
-                        job_description_path,
-                        output_filename,
-                        job_title,
-                        company_name
-                    )
-
-                return matches
-                
-        except Exception as e:
-            logger.error(f"LLM matching failed: {e}")
+            json_blob = _extract_json_blob(response)
+            data = None
+            error = "no JSON object found"
+            if json_blob is not None:
+                try:
+                    data = _json_loads(json_blob)
+                except ValueError as e:
+                    error = f"invalid JSON: {e}"
+            
+            if not isinstance(data, dict):
+                # Truncated or malformed wrapper: keep whatever complete matches it holds
+                data = self._salvage_match_data(response)
+            if data is not None:
+                break
+            
+            # Unusable output must not be served from the cache on later runs
+            self._forget_cached_response(request_prompt, system_prompt)
+            if attempt == _MAX_FEEDBACK_RETRIES:
+                return None
+            logger.warning(f"Match response could not be parsed ({error}), retrying with feedback")
+            time.sleep(1.0 * (attempt + 1))
+            request_prompt = (
+                f"{prompt}\n\nYour previous response could not be parsed ({error}). "
+                "Return ONLY valid JSON in the specified format."
+            )
         
-        # Fallback
-        qualifications = self._extract_basic_qualifications(resume_text, job_description, num_quals)
-        matches = [self._create_basic_match(qual, job_description) for qual in qualifications]
-
-        # Log final qualification matches from fallback
-        logger.info(f"Final qualification matches from fallback ({len(matches)}):")
-        for i, match in enumerate(matches, 1):
-            logger.info(f"  {i}. {match.qualification.text}")
-            logger.info(f"      -> Matches: {match.job_requirement[:50]}...")
-            logger.info(f"      -> Strength: {match.match_strength}")
-
-        # Save to JSON if requested
-        should_save = save_to_json if save_to_json is not None else self.auto_save
-        if should_save:
-            self._save_matches_to_json(
-                matches,
-                job_description_path,
-                output_filename,
-                job_title,
-                company_name
+        matches = []
+        
+        for match_data in data.get('matches', [])[:num_quals]:
+            qual_data = match_data.get('qualification', {})
+            
+            # Map type string to enum value, with fallback and compatibility
+            type_str = qual_data.get('type', 'experience').lower()
+            
+            # Handle common variations and misnamed types
+            type_mapping = {
+                'skill': 'technical_skill',
+                'technical': 'technical_skill',
+                'soft': 'soft_skill',
+                'exp': 'experience',
+                'edu': 'education',
+                'cert': 'certification',
+                'achieve': 'achievement',
+                'domain': 'domain_knowledge',
+                'methodology': 'domain_knowledge'
+            }
+            
+            type_str = type_mapping.get(type_str, type_str)
+            
+            try:
+                qual_type = QualificationType(type_str)
+            except ValueError:
+                logger.warning(f"Invalid qualification type: {type_str}, defaulting to experience")
+                qual_type = QualificationType.EXPERIENCE
+            
+            qualification = Qualification(
+                text=qual_data.get('text', ''),
+                type=qual_type,
+                relevance_score=float(qual_data.get('relevance_score', 0)),
+                evidence=qual_data.get('evidence'),
+                years_experience=qual_data.get('years_experience')
             )
-
-        return matches
+            
+            match = QualificationMatch(
+                qualification=qualification,
+                job_requirement=match_data.get('job_requirement', ''),
+                match_strength=match_data.get('match_strength', 'moderate'),
+                explanation=match_data.get('explanation', '')
+            )
+            matches.append(match)
+        
+        result = {
+            'job_title': data.get('job_title'),
+            'company_name': data.get('company_name'),
+            'matches': matches
+        }
+        self._extraction_cache[cache_key] = result
+        return result
+    
+    def _salvage_match_data(self, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Recover complete match objects from a truncated or malformed JSON response.
+        
+        Args:
+            response: Raw LLM response
+            
+        Returns:
+            Dictionary shaped like a parsed response ('matches' plus any job info
+            fields found), or None if no match object could be recovered
+        """
+        match_dicts = []
+        for match_start in _MATCH_OBJECT_START_PATTERN.finditer(response):
+            blob = _extract_json_blob(response, match_start.start())
+            if blob is None:
+                break
+            try:
+                match_dicts.append(_json_loads(blob))
+            except ValueError:
+                continue
+        
+        if not match_dicts:
+            return None
+        
+        logger.warning(f"Salvaged {len(match_dicts)} matches from a malformed LLM response")
+        data: Dict[str, Any] = {'matches': match_dicts}
+        for field in _JOB_INFO_FIELD_PATTERN.finditer(response):
+            try:
+                data.setdefault(field.group(1), _json_loads(field.group(2)))
+            except ValueError:
+                continue
+        return data
     
     def generate_qualification_summary(
         self,
@@ -688,7 +1469,7 @@ Requirements:
 - Natural flow
 - Emphasize strongest qualifications"""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
+            response = self._cached_generate(prompt, system_prompt)
             return response.strip()
             
         except Exception as e:
@@ -712,20 +1493,11 @@ Requirements:
             Sorted list of qualifications
         """
         if criteria == "relevance":
-            return sorted(qualifications, key=lambda x: x.relevance_score, reverse=True)
+            return sorted(qualifications, key=attrgetter('relevance_score'), reverse=True)
         elif criteria == "experience":
             return sorted(qualifications, key=lambda x: x.years_experience or 0, reverse=True)
         elif criteria == "type":
-            type_order = {
-                QualificationType.EXPERIENCE: 1,
-                QualificationType.TECHNICAL_SKILL: 2,
-                QualificationType.CERTIFICATION: 3,
-                QualificationType.EDUCATION: 4,
-                QualificationType.ACHIEVEMENT: 5,
-                QualificationType.DOMAIN_KNOWLEDGE: 6,
-                QualificationType.SOFT_SKILL: 7
-            }
-            return sorted(qualifications, key=lambda x: type_order.get(x.type, 8))
+            return sorted(qualifications, key=lambda x: _TYPE_ORDER.get(x.type, 8))
         else:
             return qualifications
     
@@ -768,8 +1540,7 @@ Requirements:
             Years as integer or None
         """
         # Look for patterns like "5+ years", "10 years", etc.
-        pattern = r'(\d+)\+?\s*years?'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _YEARS_PATTERN.search(text)
         if match:
             return int(match.group(1))
         return None
@@ -822,9 +1593,20 @@ Requirements:
             True if qualifications are similar
         """
         # Simple similarity check based on word overlap
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return self._word_sets_similar(set(text1.lower().split()), set(text2.lower().split()), threshold)
+
+    def _word_sets_similar(self, words1: set, words2: set, threshold: float = 0.7) -> bool:
+        """
+        Check if two pre-split, lowercased word sets are similar (Jaccard similarity).
+
+        Args:
+            words1: Words of the first qualification
+            words2: Words of the second qualification
+            threshold: Similarity threshold (0.0 to 1.0)
 
+        Returns:
+            True if the word sets are similar
+        """
         if not words1 or not words2:
             return False
 
@@ -844,16 +1626,21 @@ Requirements:
         """Basic qualification extraction without LLM."""
         qualifications = []
         
+        # All keyword probes below are ASCII, so scan lowercased bytes once per
+        # document instead of re-lowercasing and dispatching on str kinds
+        job_lower = job_description.encode('ascii', 'ignore').lower()
+        resume_lower = resume_text.encode('ascii', 'ignore').lower()
+        
         # Extract years of experience with more specific context
-        exp_match = re.search(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', resume_text, re.I)
+        exp_match = _EXPERIENCE_YEARS_PATTERN.search(resume_text)
         if exp_match:
             years = int(exp_match.group(1))
             # Check if job mentions specific tech stack
-            if 'react' in job_description.lower():
+            if b'react' in job_lower:
                 text = f"{years}+ Years React Development Experience"
-            elif 'javascript' in job_description.lower() or 'js' in job_description.lower():
+            elif b'javascript' in job_lower or b'js' in job_lower:
                 text = f"{years}+ Years JavaScript Full Stack Experience"
-            elif 'node' in job_description.lower():
+            elif b'node' in job_lower:
                 text = f"{years}+ Years Node.js Development Experience"
             else:
                 text = f"{years}+ Years Software Development Experience"
@@ -866,13 +1653,8 @@ Requirements:
             ))
         
         # Extract education
-        education_patterns = [
-            r"(Bachelor'?s?|Master'?s?|PhD|Ph\.D\.|MBA)\s+(?:degree\s+)?(?:in\s+)?([A-Za-z\s]+)",
-            r"(B\.S\.|M\.S\.|B\.A\.|M\.A\.)\s+(?:in\s+)?([A-Za-z\s]+)"
-        ]
-        
-        for pattern in education_patterns:
-            match = re.search(pattern, resume_text, re.I)
+        for pattern in _EDUCATION_PATTERNS:
+            match = pattern.search(resume_text)
             if match:
                 degree = match.group(1)
                 field = match.group(2).strip()
@@ -883,62 +1665,16 @@ Requirements:
                 ))
                 break
         
-        # Extract key skills mentioned in job description
-        job_lower = job_description.lower()
-        resume_lower = resume_text.lower()
-        
-        # Expanded and prioritized skill keywords based on the job
-        skill_keywords = []
-        
-        # Prioritize skills mentioned in the job
-        if 'react' in job_lower:
-            skill_keywords.append('react')
-        if 'node' in job_lower or 'nodejs' in job_lower:
-            skill_keywords.append('node.js')
-        if 'typescript' in job_lower:
-            skill_keywords.append('typescript')
-        if 'javascript' in job_lower:
-            skill_keywords.append('javascript')
-        if 'mongodb' in job_lower:
-            skill_keywords.append('mongodb')
-        if 'postgresql' in job_lower:
-            skill_keywords.append('postgresql')
-            
-        # Add other common skills
-        skill_keywords.extend(['python', 'java', 'docker', 'kubernetes', 'aws', 'azure', 'sql', 'api', 'agile', 'scrum'])
-        
-        found_skills = []
-        for skill in skill_keywords:
-            if skill.lower() in resume_lower and skill.lower() in job_lower:
-                found_skills.append(skill)
+        # Extract key skills mentioned in both job description and resume;
+        # per-document hits are cached, so this is a priority-ordered set intersection
+        common_skills = _skill_hits(job_lower) & _skill_hits(resume_lower)
+        found_skills = [skill for skill in _BASIC_SKILL_KEYWORDS if skill in common_skills]
         
         # Create concise qualification texts (max 20 words)
         for skill in found_skills[:2]:  # Add top 2 skills
-            skill_name = skill.capitalize()
-            if skill in ['react']:
-                text = "React Frontend Development Expertise"
-            elif skill in ['node.js', 'nodejs']:
-                text = "Node.js Backend Development Experience"
-            elif skill in ['typescript']:
-                text = "TypeScript Development Proficiency"
-            elif skill in ['javascript']:
-                text = "JavaScript Full Stack Development"
-            elif skill in ['mongodb']:
-                text = "MongoDB Database Management Experience"
-            elif skill in ['postgresql']:
-                text = "PostgreSQL Database Design Skills"
-            elif skill in ['python', 'java']:
-                text = f"{skill_name} Programming Expertise"
-            elif skill in ['docker', 'kubernetes']:
-                text = f"{skill_name} Container Orchestration"
-            elif skill in ['aws', 'azure']:
-                text = f"{skill_name} Cloud Platform Experience"
-            elif skill in ['api']:
-                text = "RESTful API Design & Integration"
-            elif skill in ['agile', 'scrum']:
-                text = f"{skill_name} Software Development Methodology"
-            else:
-                text = f"{skill_name} Technical Proficiency"
+            text = _SKILL_QUALIFICATION_TEXTS.get(skill, "{name} Technical Proficiency").format(
+                name=skill.capitalize()
+            )
             
             qualifications.append(Qualification(
                 text=text,
@@ -949,28 +1685,28 @@ Requirements:
         # Add more specific qualifications if needed
         if len(qualifications) < num_qualifications:
             # Look for specific experiences or achievements
-            if 'production' in resume_lower or 'deployed' in resume_lower:
+            if b'production' in resume_lower or b'deployed' in resume_lower:
                 qualifications.append(Qualification(
                     text="Production Application Deployment Experience",
                     type=QualificationType.EXPERIENCE,
                     relevance_score=70.0
                 ))
             
-            if 'team' in resume_lower or 'lead' in resume_lower or 'mentor' in resume_lower:
+            if b'team' in resume_lower or b'lead' in resume_lower or b'mentor' in resume_lower:
                 qualifications.append(Qualification(
                     text="Team Collaboration & Leadership Skills",
                     type=QualificationType.SOFT_SKILL,
                     relevance_score=65.0
                 ))
             
-            if 'startup' in job_lower and 'startup' in resume_lower:
+            if b'startup' in job_lower and b'startup' in resume_lower:
                 qualifications.append(Qualification(
                     text="Startup Environment Experience",
                     type=QualificationType.EXPERIENCE,
                     relevance_score=70.0
                 ))
                 
-            if 'ai' in job_lower and ('ai' in resume_lower or 'machine learning' in resume_lower):
+            if b'ai' in job_lower and (b'ai' in resume_lower or b'machine learning' in resume_lower):
                 qualifications.append(Qualification(
                     text="AI Integration & Implementation Experience",
                     type=QualificationType.TECHNICAL_SKILL,
@@ -996,21 +1732,43 @@ Requirements:
         
         return qualifications[:num_qualifications]
     
+    def _index_job_lines(self, job_description: str) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Build an inverted index from lowercase words to the first job line containing them.
+        
+        Args:
+            job_description: Job description text
+            
+        Returns:
+            Tuple of (job lines, word -> index of first line with that word)
+        """
+        job_lines = job_description.split('\n')
+        word_to_line: Dict[str, int] = {}
+        for index, line in enumerate(job_lines):
+            for word in _WORD_PATTERN.findall(line.lower()):
+                word_to_line.setdefault(word, index)
+        return job_lines, word_to_line
+    
     def _create_basic_match(
         self,
         qualification: Qualification,
-        job_description: str
+        job_description: str,
+        job_index: Optional[Tuple[List[str], Dict[str, int]]] = None
     ) -> QualificationMatch:
         """Create a basic qualification match without LLM."""
-        # Simple matching logic
-        job_lines = job_description.split('\n')
-        
-        # Find a relevant line from job description
-        relevant_line = ""
-        for line in job_lines:
-            if any(word in line.lower() for word in qualification.text.lower().split()):
-                relevant_line = line.strip()
-                break
+        # Simple matching logic; callers matching several qualifications
+        # against the same job pass the prebuilt index in
+        if job_index is None:
+            job_index = self._index_job_lines(job_description)
+        job_lines, word_to_line = job_index
+        
+        # Find the first job line sharing a word with the qualification
+        line_indexes = [
+            word_to_line[word]
+            for word in _WORD_PATTERN.findall(qualification.text.lower())
+            if word in word_to_line
+        ]
+        relevant_line = job_lines[min(line_indexes)].strip() if line_indexes else ""
         
         if not relevant_line and job_lines:
             relevant_line = job_lines[0].strip()
@@ -1040,108 +1798,16 @@ Requirements:
         Returns:
             Formatted text representation of personal info
         """
-        try:
-            with open(personal_info_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Personal info file not found: {personal_info_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in personal info file: {e}")
-        
-        # Convert personal_info.json to resume-like text
-        text_parts = []
-        
-        # Personal Information
-        personal_info = data.get('personal_info', {})
-        text_parts.append(f"Name: {personal_info.get('name', 'Unknown')}")
-        text_parts.append(f"Title: {personal_info.get('job_title', 'Professional')}")
-        text_parts.append(f"Email: {personal_info.get('email', '')}")
-        text_parts.append(f"Phone: {personal_info.get('mobile', '')}")
-        
-        # Work Information
-        work_info = data.get('work_info', {})
-        
-        # Summary
-        summary = work_info.get('summary', '')
-        if summary:
-            text_parts.append(f"\nPROFESSIONAL SUMMARY:\n{summary}")
-        
-        # Experience
-        experience = work_info.get('experience', [])
-        if experience:
-            text_parts.append("\nWORK EXPERIENCE:")
-            for exp in experience:
-                text_parts.append(f"\n{exp.get('role', 'Unknown Role')} at {exp.get('company', 'Unknown Company')}")
-                text_parts.append(f"Location: {exp.get('location', '')}")
-                text_parts.append(f"Period: {exp.get('period', '')}")
-                
-                features = exp.get('features', [])
-                if features:
-                    for feature in features:
-                        text_parts.append(f"• {feature}")
-        
-        # Skills
-        skills = work_info.get('skills', {})
-        
-        # Hard Skills
-        hard_skills = skills.get('hard_skills', [])
-        if hard_skills:
-            text_parts.append("\nTECHNICAL SKILLS:")
-            for skill_category in hard_skills:
-                category = skill_category.get('category', '')
-                skill_list = skill_category.get('skill_list', [])
-                if skill_list:
-                    text_parts.append(f"{category}: {', '.join(skill_list)}")
-        
-        # Soft Skills
-        soft_skills = skills.get('soft_skills', [])
-        if soft_skills:
-            text_parts.append("\nSOFT SKILLS:")
-            for skill_category in soft_skills:
-                category = skill_category.get('category', '')
-                skill_list = skill_category.get('skill_list', [])
-                if skill_list:
-                    text_parts.append(f"{category}: {', '.join(skill_list)}")
-        
-        # Education
-        education = data.get('education', {})
-        if education:
-            text_parts.append("\nEDUCATION:")
-            degree = education.get('degree', '')
-            school = education.get('school_location', '')
-            period = education.get('period', '')
-            text_parts.append(f"{degree}")
-            text_parts.append(f"{school} ({period})")
-        
-        # Certifications
-        certifications = data.get('certifications', [])
-        if certifications:
-            text_parts.append("\nCERTIFICATIONS:")
-            for cert in certifications:
-                name = cert.get('certification_name', '')
-                provider = cert.get('certification_provider', '')
-                date = cert.get('certification_date', '')
-                text_parts.append(f"• {name} - {provider} ({date})")
-        
-        # Other interests
-        other = data.get('other', {})
-        interests = other.get('interest_and_hobbies', [])
-        if interests:
-            text_parts.append("\nINTERESTS:")
-            for interest in interests:
-                title = interest.get('title', '')
-                content = interest.get('content', '')
-                text_parts.append(f"{title}: {content}")
-        
-        return '\n'.join(text_parts)
+        return _read_personal_info_text(personal_info_path, self._file_version(personal_info_path))
     
     def _save_qualifications_to_json(
         self,
         qualifications: List[Qualification],
-        job_description_path: str,
+        job_description_path: Optional[str],
         output_filename: Optional[str] = None,
         job_title: Optional[str] = None,
-        company_name: Optional[str] = None
+        company_name: Optional[str] = None,
+        job_description: Optional[str] = None
     ) -> str:
         """
         Save qualifications to JSON file.
@@ -1152,6 +1818,7 @@ Requirements:
             output_filename: Custom filename (default: qualifications.json)
             job_title: Job title for the position
             company_name: Company name for the position
+            job_description: Job description text, hashed into the metadata
             
         Returns:
             Path to saved JSON file
@@ -1168,38 +1835,30 @@ Requirements:
         # Convert qualifications to dict
         data = {
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._run_timestamp,
                 "job_description_file": job_description_path,
                 "job_title": job_title or "Not specified",
                 "company_name": company_name or "Not specified",
-                "num_qualifications": len(qualifications)
+                "num_qualifications": len(qualifications),
+                "input_hash": self._compute_input_hash(job_description, job_description_path)
             },
-            "qualifications": [
-                {
-                    "text": qual.text,
-                    "type": qual.type.value,
-                    "relevance_score": qual.relevance_score,
-                    "evidence": qual.evidence,
-                    "years_experience": qual.years_experience
-                }
-                for qual in qualifications
-            ]
+            "qualifications": [qual.to_dict() for qual in qualifications]
         }
         
-        # Save to JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Saved qualifications to {output_path}")
+        # Save to JSON; metadata is recorded after the write, which may keep the file on disk
+        if self._write_json_atomic(output_path, data):
+            logger.info(f"Saved qualifications to {output_path}")
+        self.last_metadata = data["metadata"]
         return str(output_path)
     
     def _save_matches_to_json(
         self,
         matches: List[QualificationMatch],
-        job_description_path: str,
+        job_description_path: Optional[str],
         output_filename: Optional[str] = None,
         job_title: Optional[str] = None,
-        company_name: Optional[str] = None
+        company_name: Optional[str] = None,
+        job_description: Optional[str] = None
     ) -> str:
         """
         Save qualification matches to JSON file.
@@ -1210,6 +1869,7 @@ Requirements:
             output_filename: Custom filename (default: qualification_matches.json)
             job_title: Job title for the position
             company_name: Company name for the position
+            job_description: Job description text, hashed into the metadata
             
         Returns:
             Path to saved JSON file
@@ -1226,36 +1886,312 @@ Requirements:
         # Convert matches to dict
         data = {
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._run_timestamp,
                 "job_description_file": job_description_path,
                 "job_title": job_title or "Not specified",
                 "company_name": company_name or "Not specified",
-                "num_matches": len(matches)
+                "num_matches": len(matches),
+                "input_hash": self._compute_input_hash(job_description, job_description_path)
             },
-            "matches": [
-                {
-                    "qualification": {
-                        "text": match.qualification.text,
-                        "type": match.qualification.type.value,
-                        "relevance_score": match.qualification.relevance_score,
-                        "evidence": match.qualification.evidence,
-                        "years_experience": match.qualification.years_experience
-                    },
-                    "job_requirement": match.job_requirement,
-                    "match_strength": match.match_strength,
-                    "explanation": match.explanation
-                }
-                for match in matches
-            ]
+            "matches": [match.to_dict() for match in matches]
+        }
+        
+        # Save to JSON; metadata is recorded after the write, which may keep the file on disk
+        if self._write_json_atomic(output_path, data):
+            logger.info(f"Saved qualification matches to {output_path}")
+        self.last_metadata = data["metadata"]
+        return str(output_path)
+    
+    def _cached_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stop_after_quotes: Optional[int] = None
+    ) -> str:
+        """
+        Generate an LLM response, reusing a cached response for an identical request.
+        
+        The cache key covers the model, temperature, system prompt and prompt.
+        Hits are served from memory first, then from cache_dir on disk; entries
+        older than cache_ttl are regenerated.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            stop_after_quotes: If set, stream the response and stop once it holds
+                this many usable quoted qualification items
+            
+        Returns:
+            LLM response text
+        """
+        if not self.cache_llm_responses:
+            return self._generate(prompt, system_prompt, stop_after_quotes)
+        
+        cache_key = self._response_cache_key(prompt, system_prompt, stop_after_quotes)
+        response = self._response_cache.get(cache_key)
+        if response is not None:
+            logger.debug(f"LLM response cache hit ({cache_key[:12]})")
+            return response
+        
+        response = self._generate(prompt, system_prompt, stop_after_quotes)
+        self._response_cache.put(cache_key, response)
+        return response
+    
+    def _generate(self, prompt: str, system_prompt: Optional[str], stop_after_quotes: Optional[int]) -> str:
+        """
+        Call the LLM, streaming with an early stop when stop_after_quotes is set.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            stop_after_quotes: Number of usable quoted items to stop after, or None
+            
+        Returns:
+            LLM response text
+        """
+        if stop_after_quotes is None:
+            return self.llm_client.generate(prompt, system_prompt=system_prompt)
+        return self.llm_client.generate_until(
+            prompt,
+            system_prompt=system_prompt,
+            stop_when=lambda text: _count_quoted_qualifications(text) >= stop_after_quotes,
+            stop_trigger='"'
+        )
+    
+    def _response_cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        stop_after_quotes: Optional[int] = None
+    ) -> str:
+        """
+        Build the LLM response cache key for a request.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            stop_after_quotes: Early-stop item count; a response cut at N items
+                must not be served to a request wanting more
+            
+        Returns:
+            Hex digest covering the model, temperature, system prompt and prompt
+        """
+        parts = [
+            str(getattr(self.llm_client, 'model', '')),
+            str(getattr(self.llm_client, 'temperature', '')),
+            system_prompt or '',
+            prompt
+        ]
+        if stop_after_quotes is not None:
+            parts.append(str(stop_after_quotes))
+        return canonical_key(*parts)
+    
+    def _forget_cached_response(self, prompt: str, system_prompt: Optional[str] = None) -> None:
+        """
+        Drop a cached LLM response, in memory and on disk, e.g. after it failed to parse.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+        """
+        if not self.cache_llm_responses:
+            return
+        self._response_cache.forget(self._response_cache_key(prompt, system_prompt))
+    
+    def _canonical_job_description(self, job_description: str) -> str:
+        """
+        Map a job description to a near-identical one seen before, so its cached LLM responses are reused.
+        
+        Similarity is the Jaccard index of the lowercased word sets. Descriptions
+        with no match at or above near_match_threshold are recorded in cache_dir
+        for later runs and returned unchanged.
+        
+        Args:
+            job_description: Job description text
+            
+        Returns:
+            The most similar known job description, or job_description itself
+        """
+        threshold = self.near_match_threshold
+        if threshold is None or not self.cache_llm_responses:
+            return job_description
+        
+        known = self._load_known_job_descriptions()
+        if any(known_text == job_description for _, known_text in known):
+            return job_description
+        
+        words = frozenset(_WORD_PATTERN.findall(job_description.lower()))
+        match = find_near_match(words, known, threshold)
+        if match is not None:
+            best_text, best_score = match
+            logger.info(f"Reusing results for a near-identical job description (similarity {best_score:.2f})")
+            return best_text
+        
+        known.append((words, job_description))
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / "job_descriptions.ndjson", 'ab') as f:
+                f.write(_json_dumps_line({"text": job_description}))
+        except OSError as e:
+            logger.warning(f"Could not record job description for near-match lookups: {e}")
+        return job_description
+    
+    def _load_known_job_descriptions(self) -> List[Tuple[FrozenSet[str], str]]:
+        """
+        Load the job descriptions recorded by _canonical_job_description, once per extractor.
+        
+        Returns:
+            List of (word set, text) pairs
+        """
+        if self._known_job_descriptions is None:
+            known = []
+            try:
+                with open(self.cache_dir / "job_descriptions.ndjson", 'rb') as f:
+                    for line in f:
+                        try:
+                            text = _json_loads(line)['text']
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        known.append((frozenset(_WORD_PATTERN.findall(text.lower())), text))
+            except OSError:
+                pass
+            self._known_job_descriptions = known
+        return self._known_job_descriptions
+    
+    def save_matches_to_jsonl(
+        self,
+        matches: List[QualificationMatch],
+        job_description_path: Optional[str],
+        output_filename: Optional[str] = None,
+        job_title: Optional[str] = None,
+        company_name: Optional[str] = None,
+        job_description: Optional[str] = None
+    ) -> str:
+        """
+        Save qualification matches as JSON Lines: a metadata line, then one line per match.
+        
+        Each match is serialized and written on its own, so large match sets are
+        streamed instead of being held as one serialized document.
+        
+        Args:
+            matches: List of QualificationMatch objects
+            job_description_path: Path to job description file (used for metadata)
+            output_filename: Custom filename (default: qualification_matches.jsonl)
+            job_title: Job title for the position
+            company_name: Company name for the position
+            job_description: Job description text, hashed into the metadata
+                (default: loaded from job_description_path)
+            
+        Returns:
+            Path to saved JSONL file
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self.output_dir / (output_filename or "qualification_matches.jsonl")
+        
+        metadata = {
+            "timestamp": self._run_timestamp,
+            "job_description_file": job_description_path,
+            "job_title": job_title or "Not specified",
+            "company_name": company_name or "Not specified",
+            "num_matches": len(matches),
+            "input_hash": self._compute_input_hash(job_description, job_description_path)
         }
         
-        # Save to JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        lines = [_json_dumps_line({"metadata": metadata})]
+        lines.extend(_json_dumps_line(match.to_dict()) for match in matches)
+        write_file_atomic(output_path, lines)
+        self.last_metadata = metadata
         
         logger.info(f"Saved qualification matches to {output_path}")
         return str(output_path)
     
+    def _compute_input_hash(
+        self,
+        job_description: Optional[str],
+        job_description_path: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Hash the job description text so saved JSON can be matched to its input.
+        
+        Args:
+            job_description: Job description text the results were produced from
+            job_description_path: Used only when the text is not given; loaded
+                through the per-file-version cache rather than read again
+            
+        Returns:
+            Hex digest of the text, or None if there is none
+        """
+        if job_description is None:
+            try:
+                job_description = self._load_job_description(job_description_path)
+            except (ValueError, OSError, TypeError):
+                return None
+        return hashlib.blake2b(job_description.encode('utf-8')).hexdigest()
+    
+    def _write_json_atomic(self, output_path: Path, data: Dict[str, Any]) -> bool:
+        """
+        Write JSON data via a temporary file and os.replace so readers never see a torn file.
+        
+        The write is skipped when the existing file was produced from the same input
+        (matching metadata input_hash) and differs only in its timestamp; data's
+        timestamp is then set to the one on disk, so data always matches the file.
+        
+        Args:
+            output_path: Destination JSON file
+            data: Data to serialize
+            
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        input_hash = data.get("metadata", {}).get("input_hash")
+        if input_hash:
+            # A missing file surfaces as OSError; no separate exists() stat
+            try:
+                with open(output_path, 'rb') as f:
+                    existing = _json_loads(f.read())
+                if self._without_timestamp(existing) == self._without_timestamp(data):
+                    logger.debug(f"{output_path} is up to date, skipping write")
+                    data["metadata"]["timestamp"] = existing["metadata"].get("timestamp")
+                    return False
+            except (OSError, ValueError):
+                pass
+        
+        write_file_atomic(output_path, [_json_dumps_pretty(data)])
+        return True
+    
+    def _without_timestamp(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a shallow copy of saved JSON data with the metadata timestamp removed."""
+        metadata = {k: v for k, v in data.get("metadata", {}).items() if k != "timestamp"}
+        return {**data, "metadata": metadata}
+    
+    def append_qualifications_to_ndjson(
+        self,
+        qualifications: List[Qualification],
+        output_filename: str = "qualifications.ndjson"
+    ) -> str:
+        """
+        Append qualifications to a newline-delimited JSON file, one object per line.
+        
+        Unlike the JSON saves, repeat runs accumulate into the same file so
+        downstream tools can stream-read it line by line.
+        
+        Args:
+            qualifications: List of Qualification objects
+            output_filename: NDJSON filename inside the output directory
+            
+        Returns:
+            Path to the NDJSON file
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self.output_dir / output_filename
+        
+        payload = b''.join(_json_dumps_line(qual.to_dict()) for qual in qualifications)
+        with open(output_path, 'ab') as f:
+            f.write(payload)
+        
+        logger.info(f"Appended {len(qualifications)} qualifications to {output_path}")
+        return str(output_path)
+    
     def load_qualifications_from_json(self, json_path: str) -> List[Qualification]:
         """
         Load qualifications from a previously saved JSON file.
@@ -1266,23 +2202,60 @@ Requirements:
         Returns:
             List of Qualification objects
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = _json_loads(f.read())
         
-        qualifications = []
-        for qual_data in data.get('qualifications', []):
-            qual_type = QualificationType(qual_data.get('type', 'experience'))
+        return self.load_qualifications_from_dict(data)
+    
+    def load_qualifications_from_dict(self, data: Dict[str, Any]) -> List[Qualification]:
+        """
+        Build qualifications from an already parsed qualifications JSON document.
+        
+        Lets callers that also need the metadata parse the file only once.
+        
+        Args:
+            data: Parsed JSON as written by the qualifications save
             
-            qualification = Qualification(
-                text=qual_data.get('text', ''),
-                type=qual_type,
-                relevance_score=float(qual_data.get('relevance_score', 0)),
-                evidence=qual_data.get('evidence'),
-                years_experience=qual_data.get('years_experience')
-            )
-            qualifications.append(qualification)
+        Returns:
+            List of Qualification objects
+        """
+        return [self._qualification_from_dict(qual_data) for qual_data in data.get('qualifications', [])]
+    
+    def load_qualifications_from_ndjson(self, ndjson_path: str) -> List[Qualification]:
+        """
+        Load qualifications from a newline-delimited JSON file.
         
-        return qualifications
+        Args:
+            ndjson_path: Path to NDJSON file written by append_qualifications_to_ndjson
+            
+        Returns:
+            List of Qualification objects
+        """
+        with open(ndjson_path, 'rb') as f:
+            return [self._qualification_from_dict(_json_loads(line)) for line in f if line.strip()]
+    
+    def _qualification_from_dict(self, qual_data: Dict[str, Any]) -> Qualification:
+        """
+        Build a Qualification from its saved dictionary form.
+        
+        Args:
+            qual_data: Dictionary as produced by Qualification.to_dict()
+            
+        Returns:
+            Qualification object
+        """
+        type_value = qual_data.get('type', 'experience')
+        qual_type = _QUALIFICATION_TYPES_BY_VALUE.get(type_value)
+        if qual_type is None:
+            qual_type = QualificationType(type_value)  # Raises ValueError for unknown types
+        
+        return Qualification(
+            text=qual_data.get('text', ''),
+            type=qual_type,
+            relevance_score=float(qual_data.get('relevance_score', 0)),
+            evidence=qual_data.get('evidence'),
+            years_experience=qual_data.get('years_experience')
+        )
     
     def _extract_job_info(self, job_description: str) -> Dict[str, Optional[str]]:
         """
@@ -1297,6 +2270,11 @@ Requirements:
         if not self.use_llm or not self.llm_client:
             return {'job_title': None, 'company_name': None}
         
+        cache_key = hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).digest()
+        cached = self._job_info_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             # Use a specific job info extraction prompt
             system_prompt = """You are an expert at extracting job information from job descriptions.
@@ -1312,7 +2290,7 @@ If the information is not found, use null for that field."""
             
             prompt = f"""Extract the job title and company name from this job description:
 
-{job_description[:1500]}
+{_truncate_text(job_description, 1500)}
 
 Important:
 1. Extract the exact job title (e.g., "Senior Software Engineer", "Data Scientist")
@@ -1320,38 +2298,53 @@ Important:
 3. If either is not found, use null
 4. Return as JSON with the specified format."""
             
-            response = self.llm_client.generate(prompt, system_prompt=system_prompt)
+            response = self._cached_generate(prompt, system_prompt)
             
             # Parse JSON response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                return {
+            json_blob = _extract_json_blob(response)
+            if json_blob is not None:
+                data = _json_loads(json_blob)
+                job_info = {
                     'job_title': data.get('job_title'),
                     'company_name': data.get('company_name')
                 }
+                self._job_info_cache[cache_key] = job_info
+                return dict(job_info)
         except Exception as e:
             logger.warning(f"Failed to extract job info: {e}")
         
         return {'job_title': None, 'company_name': None}
     
-    def _load_job_description(self, job_description_path: str) -> str:
+    def _load_job_description(
+        self,
+        job_description_path: str,
+        max_chars: int = _MAX_JOB_DESCRIPTION_CHARS
+    ) -> str:
         """
         Load job description from file.
         
         Args:
             job_description_path: Path to job description text file
+            max_chars: Maximum number of characters to read from the file
             
         Returns:
             Job description text
         """
+        return _read_job_description(job_description_path, self._file_version(job_description_path), max_chars)
+    
+    def _file_version(self, path: str) -> Tuple[int, int]:
+        """
+        Get a cheap version stamp for a file, used to key the file-loading caches.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            (st_mtime_ns, st_size), or (0, 0) if the file cannot be stat'ed
+            (the cached loader then raises the usual error)
+        """
         try:
-            with open(job_description_path, 'r', encoding='utf-8') as file:
-                content = file.read().strip()
-                if not content:
-                    raise ValueError("Job description file is empty")
-                return content
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Job description file not found: {job_description_path}")
-        except Exception as e:
-            raise ValueError(f"Error reading job description file: {e}")
\ No newline at end of file
+            stat = os.stat(path)
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
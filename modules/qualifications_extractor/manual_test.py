@@ -6,7 +6,6 @@ Tests qualification extraction from personal_info.json and job descriptions
 
 import os
 import sys
-import tempfile
 from pathlib import Path
 
 # Add path for imports
@@ -14,6 +13,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from modules.qualifications_extractor import QualificationsExtractor
 
+# Extractors shared across tests, keyed by (num_qualifications, use_llm)
+_EXTRACTORS = {}
+
+
+def get_extractor(num_qualifications, use_llm=True):
+    """Return a shared extractor so the LLM client is only set up once per configuration."""
+    key = (num_qualifications, use_llm)
+    if key not in _EXTRACTORS:
+        _EXTRACTORS[key] = QualificationsExtractor(num_qualifications=num_qualifications, use_llm=use_llm)
+    return _EXTRACTORS[key]
+
 
 def test_personal_info_file():
     """Test if personal_info.json exists and is readable."""
@@ -67,16 +77,9 @@ def test_basic_extraction():
     """
     
     try:
-        # Create temporary job file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
-        print(f"📝 Created test job file: {job_file}")
-        
         # Test extraction
-        extractor = QualificationsExtractor(num_qualifications=4)
-        qualifications = extractor.extract_qualifications(job_file)
+        extractor = get_extractor(4)
+        qualifications = extractor.extract_qualifications_from_text(job_content)
         
         print(f"✅ Extracted {len(qualifications)} qualifications:")
         for i, qual in enumerate(qualifications, 1):
@@ -88,11 +91,6 @@ def test_basic_extraction():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        # Clean up
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_custom_number_extraction():
@@ -109,15 +107,11 @@ def test_custom_number_extraction():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
         # Test different numbers
         for num_quals in [2, 6, 8]:
             print(f"\n   Testing with {num_quals} qualifications:")
-            extractor = QualificationsExtractor(num_qualifications=num_quals)
-            qualifications = extractor.extract_qualifications(job_file)
+            extractor = get_extractor(num_quals)
+            qualifications = extractor.extract_qualifications_from_text(job_content)
             
             print(f"   ✅ Got {len(qualifications)} qualifications")
             for qual in qualifications[:3]:  # Show first 3
@@ -130,10 +124,6 @@ def test_custom_number_extraction():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_output_formats():
@@ -151,12 +141,8 @@ def test_output_formats():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
-        extractor = QualificationsExtractor(num_qualifications=3)
-        qualifications = extractor.extract_qualifications(job_file)
+        extractor = get_extractor(3)
+        qualifications = extractor.extract_qualifications_from_text(job_content)
         
         # Test different formats
         formats = ["bullet", "numbered", "detailed"]
@@ -170,10 +156,6 @@ def test_output_formats():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_qualification_matching():
@@ -192,12 +174,8 @@ def test_qualification_matching():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
-        extractor = QualificationsExtractor(num_qualifications=3)
-        matches = extractor.match_qualifications_to_requirements(job_file)
+        extractor = get_extractor(3)
+        matches = extractor.match_qualifications_from_text(job_content)
         
         print(f"✅ Found {len(matches)} qualification matches:")
         for i, match in enumerate(matches, 1):
@@ -211,10 +189,6 @@ def test_qualification_matching():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_summary_generation():
@@ -230,12 +204,8 @@ def test_summary_generation():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
-        extractor = QualificationsExtractor(num_qualifications=4)
-        qualifications = extractor.extract_qualifications(job_file)
+        extractor = get_extractor(4)
+        qualifications = extractor.extract_qualifications_from_text(job_content)
         
         # Generate summary
         summary = extractor.generate_qualification_summary(qualifications)
@@ -248,10 +218,6 @@ def test_summary_generation():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_ranking():
@@ -267,12 +233,8 @@ def test_ranking():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
-        extractor = QualificationsExtractor(num_qualifications=5)
-        qualifications = extractor.extract_qualifications(job_file)
+        extractor = get_extractor(5)
+        qualifications = extractor.extract_qualifications_from_text(job_content)
         
         # Test different ranking criteria
         criteria_list = ["relevance", "type"]
@@ -290,10 +252,6 @@ def test_ranking():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def test_fallback_mode():
@@ -308,13 +266,9 @@ def test_fallback_mode():
     """
     
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(job_content)
-            job_file = f.name
-        
         # Test without LLM
-        extractor = QualificationsExtractor(num_qualifications=3, use_llm=False)
-        qualifications = extractor.extract_qualifications(job_file)
+        extractor = get_extractor(3, use_llm=False)
+        qualifications = extractor.extract_qualifications_from_text(job_content)
         
         print(f"✅ Fallback mode extracted {len(qualifications)} qualifications:")
         for qual in qualifications:
@@ -325,10 +279,6 @@ def test_fallback_mode():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
-    
-    finally:
-        if 'job_file' in locals() and os.path.exists(job_file):
-            os.unlink(job_file)
 
 
 def run_all_tests():
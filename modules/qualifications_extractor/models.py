@@ -1,11 +1,15 @@
 """Data models for qualifications extraction."""
 
+import sys
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class QualificationType(Enum):
+
+class QualificationType(str, Enum):
     """Types of qualifications."""
     TECHNICAL_SKILL = "technical_skill"
     SOFT_SKILL = "soft_skill"
@@ -16,7 +20,7 @@ class QualificationType(Enum):
     DOMAIN_KNOWLEDGE = "domain_knowledge"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Qualification:
     """Represents a single qualification."""
     text: str
@@ -29,14 +33,14 @@ class Qualification:
         """Convert to dictionary."""
         return {
             "text": self.text,
-            "type": self.type.value,
+            "type": self.type,
             "relevance_score": self.relevance_score,
             "evidence": self.evidence,
             "years_experience": self.years_experience
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QualificationMatch:
     """Represents how a qualification matches the job requirements."""
     qualification: Qualification
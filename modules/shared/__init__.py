@@ -8,10 +8,12 @@ This module contains shared resources:
 - Shared constants
 """
 
-import json
-import os
+import hashlib
 from pathlib import Path
 
+from .json_io import json_loads, json_dumps_pretty, json_dumps_line, write_file_atomic
+from .response_cache import DEFAULT_CACHE_DIR, ResponseCache, find_near_match
+
 def load_personal_data(filename="personal_info.json"):
     """Load personal data from JSON file."""
     data_path = Path(__file__).parent / "data" / filename
@@ -19,7 +21,32 @@ def load_personal_data(filename="personal_info.json"):
     if not data_path.exists():
         raise FileNotFoundError(f"Data file not found: {data_path}")
     
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # One binary read; orjson parses the UTF-8 bytes without a decode step
+    return json_loads(data_path.read_bytes())
+
+def canonical_key(*parts):
+    """
+    Hash several fields into one cache key, unambiguously.
+    
+    Each part is prefixed with its 8-byte length, so ("abc", "def") and
+    ("ab", "cdef") never share a key. str parts are UTF-8 encoded.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
 
-__all__ = ['load_personal_data']
\ No newline at end of file
+__all__ = [
+    'load_personal_data',
+    'canonical_key',
+    'json_loads',
+    'json_dumps_pretty',
+    'json_dumps_line',
+    'write_file_atomic',
+    'ResponseCache',
+    'DEFAULT_CACHE_DIR',
+    'find_near_match',
+]
\ No newline at end of file
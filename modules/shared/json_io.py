@@ -0,0 +1,127 @@
+"""
+JSON encoding and atomic file writes shared by the extractor, matcher and workflow.
+
+orjson is used when installed; the stdlib json module is the fallback, with
+output kept in the same shape (2-space indent, UTF-8, non-ASCII unescaped).
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is used otherwise
+    orjson = None
+
+# Process umask, read once at import (os.umask can only be read by setting it);
+# new files written atomically get the mode a plain open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    """
+    Parse JSON with orjson when installed, falling back to the stdlib parser.
+
+    Both raise a json.JSONDecodeError subclass on invalid input.
+
+    Args:
+        raw: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _stdlib_json_dumps(data: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize data with the stdlib encoder, keeping non-ASCII text unescaped.
+
+    The ensure_ascii=True encoder is markedly faster, and for ASCII-only data its
+    output is identical, so it runs first; only output containing \\u escapes is
+    re-encoded with ensure_ascii=False.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indentation passed to json.dumps
+
+    Returns:
+        Encoded JSON text
+    """
+    text = json.dumps(data, indent=indent)
+    if '\\u' in text:
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+    return text
+
+
+def json_dumps_pretty(data: Any) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON, using orjson when installed.
+
+    Non-string dict keys are converted to strings, as the stdlib encoder does.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return _stdlib_json_dumps(data, indent=2).encode('utf-8')
+
+
+def json_dumps_line(data: Any) -> bytes:
+    """
+    Serialize data as one compact UTF-8 JSON line (NDJSON), using orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (_stdlib_json_dumps(data) + '\n').encode('utf-8')
+
+
+def write_file_atomic(output_path: Union[str, Path], chunks: Iterable[bytes]) -> None:
+    """
+    Atomically replace a file: write a temporary file, fsync it, then os.replace.
+
+    A crash mid-write leaves the previous file intact rather than a truncated one.
+    The file keeps the replaced file's permissions, or gets the umask default if
+    it is new (mkstemp alone would leave it owner-only).
+
+    Args:
+        output_path: Destination file
+        chunks: Encoded content, written in order
+    """
+    output_path = Path(output_path)
+    try:
+        mode = os.stat(output_path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    # Unique temp file so concurrent writers never share a partial write
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=output_path.name + '.', suffix='.tmp')
+    try:
+        with open(fd, 'wb', buffering=65536) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,166 @@
+"""
+LLM response cache shared by the qualifications extractor and the keyword matcher.
+
+Responses are kept in a bounded in-memory LRU tier in front of one JSON file
+per cache key ({"created": <epoch seconds>, "response": <text>}) in cache_dir.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import FrozenSet, Iterable, Optional, Tuple, TypeVar, Union
+
+from .json_io import json_dumps_line, json_loads, write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Entries kept in the in-memory tier; least recently used go first
+# (they remain on disk until the TTL expires)
+DEFAULT_MEMORY_SIZE = 256
+
+# Default on-disk location, anchored here so it doesn't depend on the working directory
+# (covered by the /modules/shared/cache/ entry in .gitignore)
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "llm"
+
+
+class ResponseCache:
+    """
+    Two-tier (memory, then disk) cache of LLM responses with a TTL.
+
+    Safe to share between threads, e.g. batch matching in executor threads.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        ttl: float = 86400.0,
+        memory_size: int = DEFAULT_MEMORY_SIZE
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cache key
+            ttl: Seconds a cached response stays valid
+            memory_size: Entries kept in the in-memory tier
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # Guards _memory; a lookup's get and move_to_end must not interleave with an eviction
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: str, now: Optional[float] = None) -> Optional[str]:
+        """
+        Return a fresh cached response, from memory or else from cache_dir.
+
+        Args:
+            cache_key: Response cache key
+            now: Current time, for the TTL check (default: time.time())
+
+        Returns:
+            The cached response, or None if absent or expired
+        """
+        if now is None:
+            now = time.time()
+        with self._lock:
+            cached = self._memory.get(cache_key)
+            if cached is not None:
+                self._memory.move_to_end(cache_key)
+        if cached is None:
+            # Disk reads happen outside the lock
+            try:
+                with open(self._path(cache_key), 'rb') as f:
+                    entry = json_loads(f.read())
+                cached = (float(entry['created']), entry['response'])
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._remember(cache_key, cached)
+
+        if now - cached[0] < self.ttl:
+            return cached[1]
+        return None
+
+    def put(self, cache_key: str, response: str, now: Optional[float] = None) -> None:
+        """
+        Store a response in memory and persist it to cache_dir.
+
+        A failed disk write is logged; the in-memory entry is kept.
+
+        Args:
+            cache_key: Response cache key
+            response: Response text
+            now: Creation time recorded with the entry (default: time.time())
+        """
+        if now is None:
+            now = time.time()
+        self._remember(cache_key, (now, response))
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(self._path(cache_key), [json_dumps_line({"created": now, "response": response})])
+        except OSError as e:
+            logger.warning(f"Could not persist LLM response cache entry: {e}")
+
+    def forget(self, cache_key: str) -> None:
+        """
+        Drop a cached response, in memory and on disk, e.g. after it failed to parse.
+
+        Args:
+            cache_key: Response cache key
+        """
+        with self._lock:
+            self._memory.pop(cache_key, None)
+        try:
+            os.unlink(self._path(cache_key))
+        except OSError:
+            pass
+
+    def _remember(self, cache_key: str, entry: Tuple[float, str]) -> None:
+        """Store an entry in the in-memory tier, evicting the least recently used."""
+        with self._lock:
+            self._memory[cache_key] = entry
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _path(self, cache_key: str) -> Path:
+        """On-disk location of a cache entry."""
+        return self.cache_dir / f"{cache_key}.json"
+
+
+def find_near_match(
+    words: FrozenSet[str],
+    candidates: Iterable[Tuple[FrozenSet[str], T]],
+    threshold: float
+) -> Optional[Tuple[T, float]]:
+    """
+    Find the candidate whose word set is most similar to words (Jaccard index).
+
+    Args:
+        words: Word set to match
+        candidates: (word set, value) pairs
+        threshold: Minimum Jaccard index for a match
+
+    Returns:
+        (value, similarity) of the best candidate at or above threshold, or None
+    """
+    best_value, best_score = None, 0.0
+    found = False
+    for known_words, value in candidates:
+        smaller, larger = sorted((len(words), len(known_words)))
+        # Jaccard can't exceed smaller/larger, so skip pairs that can't reach the threshold
+        if not larger or smaller < threshold * larger:
+            continue
+        score = len(words & known_words) / len(words | known_words)
+        if score > best_score:
+            best_value, best_score, found = value, score, True
+
+    if found and best_score >= threshold:
+        return best_value, best_score
+    return None
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Tests for the shared cache key, JSON and LLM response cache helpers."""
+
+import json
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.shared import (
+    ResponseCache,
+    canonical_key,
+    find_near_match,
+    json_dumps_line,
+    json_dumps_pretty,
+    json_loads,
+    write_file_atomic,
+)
+from modules.shared import json_io
+
+SAMPLE = {"name": "Zoë", "skills": ["Python", "日本語"], "score": 87.5, "nested": {"ok": True, "none": None}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+def test_canonical_key_is_unambiguous():
+    """Field boundaries are part of the key."""
+    assert canonical_key("abc", "def") != canonical_key("ab", "cdef")
+    assert canonical_key("abc", "") != canonical_key("", "abc")
+    assert canonical_key("abc", "def") == canonical_key(b"abc", b"def")
+    assert len(canonical_key("x")) == 64
+
+
+def test_json_round_trip(json_backend):
+    """Both encoders produce JSON that parses back to the same data."""
+    pretty = json_dumps_pretty(SAMPLE)
+    line = json_dumps_line(SAMPLE)
+
+    assert json_loads(pretty) == SAMPLE
+    assert json_loads(line) == SAMPLE
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    # Non-ASCII text is written as UTF-8, not \u escapes
+    assert "Zoë".encode("utf-8") in pretty
+    assert b"\\u" not in pretty
+    # 2-space indentation
+    assert b'\n  "name"' in pretty
+
+
+def test_json_backends_agree():
+    """The stdlib fallback parses to the same data orjson does."""
+    if json_io.orjson is None:
+        pytest.skip("orjson is not installed")
+    fast = json_dumps_pretty(SAMPLE)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(json_io, "orjson", None)
+        slow = json_dumps_pretty(SAMPLE)
+        assert json_loads(fast) == json_loads(slow) == SAMPLE
+
+
+def test_json_non_string_keys(json_backend):
+    """Non-string dict keys become strings, as the stdlib encoder does."""
+    assert json_loads(json_dumps_pretty({1: "a"})) == {"1": "a"}
+    assert json_loads(json_dumps_line({2: "b"})) == {"2": "b"}
+
+
+def test_json_loads_rejects_invalid(json_backend):
+    """Invalid input raises a ValueError (JSONDecodeError) with either parser."""
+    with pytest.raises(ValueError):
+        json_loads(b"{not json")
+
+
+def test_write_file_atomic_writes_and_replaces(tmp_path):
+    """The file holds the joined chunks; a rewrite replaces it."""
+    path = tmp_path / "out.json"
+    write_file_atomic(path, [b"first"])
+    write_file_atomic(path, [b"sec", b"ond"])
+
+    assert path.read_bytes() == b"second"
+    assert os.listdir(tmp_path) == ["out.json"]
+
+
+def test_write_file_atomic_permissions(tmp_path):
+    """New files get the umask default; replaced files keep their mode."""
+    new_path = tmp_path / "new.json"
+    write_file_atomic(new_path, [b"{}"])
+    assert stat.S_IMODE(new_path.stat().st_mode) == 0o666 & ~json_io._UMASK
+
+    existing = tmp_path / "existing.json"
+    existing.write_bytes(b"{}")
+    existing.chmod(0o640)
+    write_file_atomic(existing, [b"[]"])
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+
+def test_write_file_atomic_failure_keeps_old_file(tmp_path):
+    """A failed write leaves the previous file and no temporary file behind."""
+    path = tmp_path / "out.json"
+    path.write_bytes(b"old")
+
+    def chunks():
+        yield b"partial"
+        raise RuntimeError("serialization failed")
+
+    with pytest.raises(RuntimeError):
+        write_file_atomic(path, chunks())
+
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["out.json"]
+
+
+def test_response_cache_memory_and_disk(tmp_path):
+    """A stored response is served from memory and, by a new instance, from disk."""
+    cache = ResponseCache(tmp_path, ttl=60)
+    cache.put("key", "response", now=1000.0)
+
+    assert cache.get("key", now=1001.0) == "response"
+    assert cache.get("missing", now=1001.0) is None
+
+    reopened = ResponseCache(tmp_path, ttl=60)
+    assert reopened.get("key", now=1001.0) == "response"
+    entry = json.loads((tmp_path / "key.json").read_text(encoding="utf-8"))
+    assert entry == {"created": 1000.0, "response": "response"}
+
+
+def test_response_cache_ttl(tmp_path):
+    """Entries older than the TTL are treated as missing, in memory and on disk."""
+    cache = ResponseCache(tmp_path, ttl=60)
+    cache.put("key", "response", now=1000.0)
+
+    assert cache.get("key", now=1059.0) == "response"
+    assert cache.get("key", now=1060.0) is None
+    assert ResponseCache(tmp_path, ttl=60).get("key", now=1060.0) is None
+
+
+def test_response_cache_lru_eviction(tmp_path):
+    """The memory tier keeps the most recently used entries; evicted ones stay on disk."""
+    cache = ResponseCache(tmp_path, ttl=60, memory_size=2)
+    cache.put("a", "A", now=1000.0)
+    cache.put("b", "B", now=1000.0)
+    cache.get("a", now=1000.0)  # "b" is now least recently used
+    cache.put("c", "C", now=1000.0)
+
+    assert list(cache._memory) == ["a", "c"]
+    # "b" is reloaded from disk, evicting "a"
+    assert cache.get("b", now=1000.0) == "B"
+    assert list(cache._memory) == ["c", "b"]
+
+
+def test_response_cache_forget_and_corrupt_entry(tmp_path):
+    """forget drops both tiers; an unreadable disk entry reads as a miss."""
+    cache = ResponseCache(tmp_path, ttl=60)
+    cache.put("key", "response", now=1000.0)
+    cache.forget("key")
+
+    assert cache.get("key", now=1000.0) is None
+    assert not (tmp_path / "key.json").exists()
+    cache.forget("key")  # Forgetting a missing key is a no-op
+
+    (tmp_path / "bad.json").write_bytes(b"{truncated")
+    assert cache.get("bad", now=1000.0) is None
+
+
+def test_response_cache_failed_disk_write_keeps_memory(tmp_path):
+    """If cache_dir can't be written, the response is still cached in memory."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_bytes(b"")
+    cache = ResponseCache(blocker / "cache", ttl=60)
+    cache.put("key", "response", now=1000.0)
+
+    assert cache.get("key", now=1000.0) == "response"
+
+
+def test_response_cache_thread_safety(tmp_path):
+    """Concurrent gets and puts on a small memory tier neither fail nor lose entries."""
+    cache = ResponseCache(tmp_path, ttl=60, memory_size=4)
+    errors = []
+
+    def worker(worker_id):
+        try:
+            for i in range(200):
+                key = f"k{(worker_id + i) % 16}"
+                cache.put(key, key.upper(), now=1000.0)
+                value = cache.get(key, now=1000.0)
+                assert value == key.upper()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache._memory) <= 4
+    for n in range(16):
+        assert cache.get(f"k{n}", now=1000.0) == f"K{n}"
+
+
+def test_find_near_match():
+    """The most similar candidate at or above the threshold wins."""
+    words = frozenset("senior python engineer aws docker".split())
+    candidates = [
+        (frozenset("senior python engineer aws".split()), "close"),
+        (frozenset("senior python engineer aws docker kubernetes".split()), "closer"),
+        (frozenset("junior designer figma".split()), "far"),
+    ]
+
+    assert find_near_match(words, candidates, 0.8) == ("closer", 5 / 6)
+    assert find_near_match(words, candidates[:1], 0.8) == ("close", 0.8)
+    assert find_near_match(words, candidates, 0.9) is None
+    assert find_near_match(words, [], 0.5) is None
+    # Empty word sets never match (and don't divide by zero)
+    assert find_near_match(frozenset(), [(frozenset(), "empty")], 0.5) is None
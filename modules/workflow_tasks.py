@@ -0,0 +1,94 @@
+"""
+Job analysis and resume parsing tasks for the workflow in main.py.
+
+These run in --batch mode's worker processes, so this module imports only the
+standard library and modules.shared; the analyzer and parser are imported on
+first use in each worker.
+"""
+
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from modules.shared import json_dumps_pretty, json_loads, write_file_atomic
+
+# Job analyses cached as JSON, keyed by a hash of the job text and of the
+# analyzer sources (including the skill lists), so editing them invalidates entries;
+# anchored to the package (and git-ignored) like the LLM response cache
+_JOB_ANALYSIS_CACHE_DIR = Path(__file__).parent / "shared" / "cache" / "job_analysis"
+_JOB_ANALYZER_SOURCE_DIRS = (
+    Path(__file__).parent / "ats_checker" / "ats_scorer" / "analyzers",
+    Path(__file__).parent / "ats_checker" / "ats_scorer" / "utils",
+)
+
+
+def create_analysis_pool():
+    """Worker processes for the CPU-bound job analysis and resume parsing
+
+    Workers come from a forkserver (or spawn where that is unavailable) rather
+    than being forked from the workflow process, which by then runs threads and
+    holds the Playwright pipes. The caller shuts the pool down.
+    """
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context(start_method))
+
+
+@lru_cache(maxsize=1)
+def _job_analyzer():
+    """JobAnalyzer built once per worker process"""
+    from modules.ats_checker.ats_scorer.analyzers.job_analyzer import JobAnalyzer
+    return JobAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _job_analyzer_fingerprint():
+    """Hash of the job analyzer's source files, computed once per process"""
+    digest = hashlib.blake2b(digest_size=16)
+    for source_dir in _JOB_ANALYZER_SOURCE_DIRS:
+        for path in sorted(source_dir.glob('*.py')):
+            digest.update(path.name.encode('utf-8'))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def analyze_job_description(job_description):
+    """Analyze the job description text for ATS scoring
+
+    Reruns on an unchanged job description load the previous analysis from
+    modules/shared/cache/job_analysis instead of analyzing it again, as long
+    as the analyzer sources are unchanged too.
+    """
+    digest = hashlib.blake2b(job_description.encode('utf-8'), digest_size=16)
+    digest.update(_job_analyzer_fingerprint().encode('ascii'))
+    cache_path = _JOB_ANALYSIS_CACHE_DIR / f"job_{digest.hexdigest()}.json"
+
+    try:
+        return json_loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable job analysis cache {cache_path}: {e}")
+
+    job_data = _job_analyzer().analyze(job_description)
+
+    try:
+        _JOB_ANALYSIS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_file_atomic(cache_path, [json_dumps_pretty(job_data)])
+    except (OSError, TypeError) as e:
+        print(f"⚠️  Could not cache job analysis: {e}")
+
+    return job_data
+
+
+@lru_cache(maxsize=1)
+def _resume_parser():
+    """ResumeParser built once per worker process"""
+    from modules.ats_checker.ats_scorer.parsers.resume_parser import ResumeParser
+    return ResumeParser()
+
+
+def parse_resume_pdf(pdf_bytes, file_name):
+    """Parse a generated resume PDF, passed in memory, for ATS scoring"""
+    return _resume_parser().parse_bytes(pdf_bytes, file_name)
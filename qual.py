@@ -11,22 +11,23 @@ Usage:
     python qual.py <job_file> --format detailed  # Detailed output format
     python qual.py <job_file> --match            # Show qualification matches
     python qual.py <job_file> --summary          # Generate summary paragraph
+    python qual.py <job_file> --no-cache         # Always call the LLM, ignoring cached responses
     python qual.py --load quals.json             # Load and display saved qualifications
 
 Note: Job title and company name are automatically extracted from the job description using AI.
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
 import json
 from datetime import datetime
+from collections import Counter
 
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from modules.qualifications_extractor import QualificationsExtractor
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -98,6 +99,17 @@ Examples:
         help='Use fallback mode without LLM (disables auto-extraction of job title/company)'
     )
     
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for cached LLM responses (default: modules/shared/cache/llm)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write cached LLM responses'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -119,7 +131,7 @@ Examples:
         sys.exit(1)
     
     # Check if job file exists
-    if not Path(args.job_file).exists():
+    if not os.path.exists(args.job_file):
         print(f"Error: Job file '{args.job_file}' not found")
         sys.exit(1)
     
@@ -131,11 +143,16 @@ def extract_qualifications(args):
     """Extract qualifications based on arguments."""
     
     try:
+        # Imported here so argument and file-check errors exit before the extractor's imports load
+        from modules.qualifications_extractor import QualificationsExtractor
+        
         # Initialize extractor
         extractor = QualificationsExtractor(
             num_qualifications=args.number,
             use_llm=not args.no_llm,
-            auto_save=not args.no_save
+            auto_save=not args.no_save,
+            cache_llm_responses=not args.no_cache,
+            cache_dir=args.cache_dir
         )
         
         if args.verbose:
@@ -161,11 +178,15 @@ def extract_qualifications(args):
                 output_filename=output_filename
             )
             
+            # Build the whole listing and write it once
+            lines = []
             for i, match in enumerate(matches, 1):
-                print(f"\n{i}. Qualification: {match.qualification.text}")
-                print(f"   Matches: {match.job_requirement[:80]}...")
-                print(f"   Strength: {match.match_strength.upper()}")
-                print(f"   Explanation: {match.explanation}")
+                lines.append(f"\n{i}. Qualification: {match.qualification.text}")
+                lines.append(f"   Matches: {match.job_requirement[:80]}...")
+                lines.append(f"   Strength: {match.match_strength.upper()}")
+                lines.append(f"   Explanation: {match.explanation}")
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
             
             if save_to_json:
                 print(f"\n✅ Matches saved to modules/shared/qualifications/")
@@ -183,15 +204,10 @@ def extract_qualifications(args):
                 output_filename=output_filename
             )
             
-            # Load the saved JSON to get the extracted job info
+            # Job info extracted during the save, without re-reading the JSON
             if save_to_json:
-                import json
-                json_file = output_filename if output_filename else "qualifications.json"
-                json_path = Path("modules/shared/qualifications") / json_file
-                if json_path.exists():
-                    with open(json_path, 'r') as f:
-                        data = json.load(f)
-                    meta = data.get('metadata', {})
+                meta = extractor.last_metadata
+                if meta:
                     job_title = meta.get('job_title', 'Not specified')
                     company_name = meta.get('company_name', 'Not specified')
                     
@@ -233,13 +249,10 @@ def extract_qualifications(args):
                 avg_score = sum(q.relevance_score for q in qualifications) / len(qualifications)
                 print(f"Average relevance score: {avg_score:.1f}%")
                 
-                types_count = {}
-                for q in qualifications:
-                    types_count[q.type.value] = types_count.get(q.type.value, 0) + 1
+                types_count = Counter(q.type.value for q in qualifications)
                 
                 print("Qualification types:")
-                for qtype, count in types_count.items():
-                    print(f"  • {qtype}: {count}")
+                sys.stdout.write("".join(f"  • {qtype}: {count}\n" for qtype, count in types_count.items()))
     
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -256,10 +269,11 @@ def load_qualifications(json_path, format_style, verbose):
         # Handle path
         if not json_path.startswith('/'):
             # Check if it's just a filename in the default directory
-            default_dir = Path("modules/shared/qualifications")
-            if (default_dir / json_path).exists():
-                json_path = str(default_dir / json_path)
-            elif not Path(json_path).exists():
+            default_dir = "modules/shared/qualifications"
+            default_path = os.path.join(default_dir, json_path)
+            if os.path.exists(default_path):
+                json_path = default_path
+            elif not os.path.exists(json_path):
                 print(f"Error: File '{json_path}' not found")
                 print(f"Hint: Check files in {default_dir}/")
                 sys.exit(1)
@@ -294,10 +308,11 @@ def load_qualifications(json_path, format_style, verbose):
                 print()
         
         # Create extractor for formatting
+        from modules.qualifications_extractor import QualificationsExtractor
         extractor = QualificationsExtractor(use_llm=False)
         
-        # Load qualifications
-        qualifications = extractor.load_qualifications_from_json(json_path)
+        # Build qualifications from the already parsed document
+        qualifications = extractor.load_qualifications_from_dict(data)
         
         # Display
         formatted = extractor.format_qualifications_list(
@@ -3,6 +3,7 @@
 Test script for qualifications extractor to ensure consistent output.
 """
 
+import logging
 import sys
 from pathlib import Path
 
@@ -11,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from modules.qualifications_extractor import QualificationsExtractor
 
+logger = logging.getLogger(__name__)
+
 
 def main():
     """Test the qualifications extractor with a sample job."""
@@ -62,23 +65,23 @@ def main():
         # Display extracted qualifications
         print("\nExtracted Qualifications:")
         print("-" * 30)
-        for i, qual in enumerate(qualifications, 1):
-            print(f'{i}. "{qual.text}"')
+        sys.stdout.write("".join(f'{i}. "{qual.text}"\n' for i, qual in enumerate(qualifications, 1)))
 
         print("\nQualification Details:")
         print("-" * 30)
+        # One write for the whole block instead of four prints per qualification
+        details = []
         for qual in qualifications:
-            print(f"• Text: {qual.text}")
-            print(f"  Type: {qual.type.value}")
-            print(f"  Score: {qual.relevance_score}%")
-            print()
+            details.append(f"• Text: {qual.text}\n")
+            details.append(f"  Type: {qual.type.value}\n")
+            details.append(f"  Score: {qual.relevance_score}%\n\n")
+        sys.stdout.write("".join(details))
 
         print("✅ Test completed successfully!")
 
     except Exception as e:
         print(f"❌ Error during test: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Qualifications extractor test failed")
 
     finally:
         # Clean up
@@ -89,4 +92,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     main()
\ No newline at end of file